@@ -1,5 +1,19 @@
 """Brix - a CLI exploration for Databricks."""
 
-from importlib.metadata import version
+import functools
 
-__version__ = version("brix")
+
+@functools.cache
+def _get_version() -> str:
+    """Read the installed package version (importlib.metadata is slow to import)."""
+    from importlib.metadata import version
+
+    return version("brix")
+
+
+def __getattr__(name: str) -> str:
+    """Resolve ``__version__`` on first access."""
+    if name == "__version__":
+        return _get_version()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -59,6 +59,8 @@ app = typer.Typer(
     cls=DbtGroup,
     help="Run dbt commands.\n\nCommands not matching built-in commands will be passed through to dbt CLI.",
     invoke_without_command=True,
+    # Mounted lazily under the root app, which owns shell completion
+    add_completion=False,
     context_settings={"allow_extra_args": True, "ignore_unknown_options": True, "help_option_names": ["-h", "--help"]},
 )
 app.add_typer(profile_app, name="profile")
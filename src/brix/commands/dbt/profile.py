@@ -21,7 +21,6 @@ from brix.modules.dbt.profile import (
     get_default_profile_path,
     init_profile,
     load_profiles,
-    run_interactive_edit,
     save_profiles,
     update_output,
     update_profile_target,
@@ -92,14 +91,19 @@ def init(
 def show() -> None:
     """Show the current profile path configuration."""
     default_path = get_default_profile_path()
-    exists = default_path.exists()
+
+    # Single read instead of exists() + read_text() to avoid a second stat
+    try:
+        contents: str | None = default_path.read_text()
+    except FileNotFoundError:
+        contents = None
 
     typer.echo(f"Profile path: {default_path}")
-    typer.echo(f"Exists: {exists}")
+    typer.echo(f"Exists: {contents is not None}")
 
-    if exists:
+    if contents is not None:
         typer.echo("\nContents:")
-        typer.echo(default_path.read_text())
+        typer.echo(contents)
 
 
 @app.command()
@@ -183,6 +187,9 @@ def edit(
         brix dbt profile edit --action delete-profile --profile old --force
     """
     if action is None:
+        # Interactive mode (questionary/prompt_toolkit are only loaded here)
+        from brix.modules.dbt.profile.prompts import run_interactive_edit
+
         run_interactive_edit(profile_path)
         return
 
@@ -1,20 +1,16 @@
 """Project management commands for dbt."""
 
+import functools
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 import typer
 
-from brix.modules.dbt.project.models import HubPackage, PackageNameError, ProjectNameError, validate_hub_package_name
-from brix.modules.dbt.project.prompts import run_dbt_deps, run_interactive_edit, run_interactive_init
-from brix.modules.dbt.project.service import (
-    ProjectExistsError,
-    fetch_package_versions_parallel,
-    get_package_version,
-    init_project,
-)
 from brix.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from brix.modules.dbt.project.models import HubPackage
+
 MaterializationType = Literal["view", "table", "ephemeral"]
 
 # Action types for CLI edit command
@@ -32,17 +28,8 @@ EditActionType = Literal[
     "update-package-version",
 ]
 
-# Known package mappings for short names
-KNOWN_PACKAGES = {
-    "dbt_utils": "dbt-labs/dbt_utils",
-    "dbt-utils": "dbt-labs/dbt_utils",
-    "elementary": "elementary-data/elementary",
-    "codegen": "dbt-labs/codegen",
-    "dbt_expectations": "calogica/dbt_expectations",
-    "dbt-expectations": "calogica/dbt_expectations",
-    "audit_helper": "dbt-labs/audit_helper",
-    "audit-helper": "dbt-labs/audit_helper",
-}
+# Edit actions handled by the path field helper
+_PATH_ACTIONS: frozenset[EditActionType] = frozenset({"add-path", "remove-path"})
 
 app = typer.Typer(
     help="Manage dbt projects.",
@@ -50,6 +37,7 @@ app = typer.Typer(
 )
 
 
+@functools.cache
 def _resolve_package_name(short_name: str) -> str:
     """Resolve short package name to full namespace/name format.
 
@@ -62,30 +50,34 @@ def _resolve_package_name(short_name: str) -> str:
     Raises:
         PackageNameError: If resolved name is not valid hub format
     """
+    from brix.modules.dbt.project.models import KNOWN_PACKAGES, validate_hub_package_name
+
     resolved = KNOWN_PACKAGES.get(short_name, short_name)
     validate_hub_package_name(resolved)
     return resolved
 
 
-def _build_package_list(packages: list[str] | None) -> list[HubPackage]:
-    """Build package list with versions from dbt Hub."""
-    pkg_names = ["dbt-labs/dbt_utils"]
-    if packages:
-        for pkg in packages:
-            resolved = _resolve_package_name(pkg) if "/" not in pkg else pkg
-            validate_hub_package_name(resolved)
-            if resolved not in pkg_names:
-                pkg_names.append(resolved)
+def _build_package_list(packages: list[str] | None) -> list["HubPackage"]:
+    """Build package list with versions from dbt Hub.
 
-    typer.echo("Fetching package versions...")
-    versions = fetch_package_versions_parallel(pkg_names)
+    Versions are echoed as each lookup completes; the returned list keeps
+    the requested order with dbt_utils first.
+    """
+    from brix.modules.dbt.project.models import KNOWN_PACKAGES, HubPackage, validate_hub_package_name
+    from brix.modules.dbt.project.service import iter_package_versions
 
-    pkg_list = []
-    for pkg_name in pkg_names:
-        version = versions[pkg_name]
-        pkg_list.append(HubPackage(package=pkg_name, version=version))
+    # Full namespace/name is the common case; only short names need the lookup
+    resolved = [pkg if "/" in pkg else KNOWN_PACKAGES.get(pkg, pkg) for pkg in packages or []]
+    # dict keys give O(1) dedup while preserving insertion order
+    pkg_names = list(dict.fromkeys(["dbt-labs/dbt_utils", *(validate_hub_package_name(n) for n in resolved)]))
+
+    typer.echo("Fetching package versions...")
+    versions: dict[str, str] = {}
+    for pkg_name, version in iter_package_versions(pkg_names):
+        versions[pkg_name] = version
         typer.echo(f"  {pkg_name}: {version}")
-    return pkg_list
+
+    return [HubPackage(package=pkg_name, version=versions[pkg_name]) for pkg_name in pkg_names]
 
 
 def _run_cli_init(
@@ -100,8 +92,15 @@ def _run_cli_init(
     with_example: bool | None,
     run_deps: bool | None,
     force: bool,
-) -> None:
-    """Run project initialization in CLI mode."""
+) -> int:
+    """Run project initialization in CLI mode.
+
+    Returns:
+        Process exit code (0 on success)
+    """
+    from brix.modules.dbt.project.models import PackageNameError, ProjectNameError
+    from brix.modules.dbt.project.service import ProjectExistsError, init_project
+
     logger = get_logger()
 
     try:
@@ -118,33 +117,35 @@ def _run_cli_init(
             force=force,
         )
         typer.echo(f"\n{result.message}")
-        typer.echo("\nFiles created:")
-        for f in result.files_created:
-            typer.echo(f"  {f}")
+        typer.echo("\n".join(["\nFiles created:", *(f"  {f}" for f in result.files_created)]))
 
         if run_deps is True:
+            # prompts pulls in questionary; only load it when deps actually run
+            from brix.modules.dbt.project.prompts import run_dbt_deps
+
             run_dbt_deps(result.project_path)
         elif run_deps is None and not no_packages:
             typer.echo(f"\nRun 'dbt deps' in {result.project_path} to install packages.")
 
         typer.echo("\nProject initialization complete!")
+        return 0
 
     except ProjectExistsError as e:
         logger.debug("Project exists error", exc_info=e)
         typer.echo(str(e), err=True)
-        raise typer.Exit(1) from None
+        return 1
     except ProjectNameError as e:
         logger.debug("Project name error", exc_info=e)
         typer.echo(str(e), err=True)
-        raise typer.Exit(1) from None
+        return 1
     except PackageNameError as e:
         logger.debug("Package name error", exc_info=e)
         typer.echo(str(e), err=True)
-        raise typer.Exit(1) from None
+        return 1
     except ValueError as e:
         logger.debug("Validation error", exc_info=e)
         typer.echo(f"Validation error: {e}", err=True)
-        raise typer.Exit(1) from None
+        return 1
 
 
 @app.command()
@@ -258,6 +259,8 @@ def init(
         brix dbt project init -n my_project -p default
     """
     if project_name is None:
+        from brix.modules.dbt.project.prompts import run_interactive_init
+
         run_interactive_init(profile_path)
         return
 
@@ -265,7 +268,7 @@ def init(
         typer.echo("--profile is required in CLI mode", err=True)
         raise typer.Exit(1)
 
-    _run_cli_init(
+    code = _run_cli_init(
         project_name=project_name,
         profile=profile,
         base_dir=base_dir,
@@ -278,6 +281,8 @@ def init(
         run_deps=run_deps,
         force=force,
     )
+    if code:
+        raise typer.Exit(code)
 
 
 def _cli_set_project_field(
@@ -286,7 +291,7 @@ def _cli_set_project_field(
     value: str | None,
     required_msg: str,
     success_msg: str,
-) -> None:
+) -> int:
     """Handle CLI set-* actions for project fields."""
     from brix.modules.dbt.project.editor import (
         InvalidFieldError,
@@ -295,10 +300,11 @@ def _cli_set_project_field(
         save_project,
         update_project_field,
     )
+    from brix.modules.dbt.project.models import ProjectNameError
 
     if not value:
         typer.echo(required_msg, err=True)
-        raise typer.Exit(1)
+        return 1
 
     try:
         project = load_project(project_path)
@@ -307,10 +313,12 @@ def _cli_set_project_field(
         typer.echo(success_msg.format(value=value))
     except (ProjectNotFoundError, InvalidFieldError, ProjectNameError) as e:
         typer.echo(str(e), err=True)
-        raise typer.Exit(1) from None
+        return 1
 
+    return 0
 
-def _cli_set_require_dbt_version(project_path: Path, value: str | None) -> None:
+
+def _cli_set_require_dbt_version(project_path: Path, value: str | None) -> int:
     """Handle CLI set-require-dbt-version action."""
     from brix.modules.dbt.project.editor import (
         InvalidFieldError,
@@ -330,7 +338,9 @@ def _cli_set_require_dbt_version(project_path: Path, value: str | None) -> None:
             typer.echo("Cleared require-dbt-version")
     except (ProjectNotFoundError, InvalidFieldError) as e:
         typer.echo(str(e), err=True)
-        raise typer.Exit(1) from None
+        return 1
+
+    return 0
 
 
 def _cli_path_action(
@@ -339,7 +349,7 @@ def _cli_path_action(
     path_field: str | None,
     path_value: str | None,
     create_dir: bool | None,
-) -> None:
+) -> int:
     """Handle CLI add-path/remove-path actions."""
     from brix.modules.dbt.project.editor import (
         InvalidFieldError,
@@ -351,7 +361,7 @@ def _cli_path_action(
 
     if not path_field or not path_value:
         typer.echo(f"--path-field and --path are required for {action} action", err=True)
-        raise typer.Exit(1)
+        return 1
 
     operation = "add" if action == "add-path" else "remove"
     try:
@@ -369,100 +379,148 @@ def _cli_path_action(
                 typer.echo(f"Created directory: {full_path}")
     except (ProjectNotFoundError, InvalidFieldError, ValueError) as e:
         typer.echo(str(e), err=True)
-        raise typer.Exit(1) from None
+        return 1
+
+    return 0
+
+
+def _cli_add_hub_package(project_path: Path, package: str | None, package_version: str | None) -> int:
+    """Handle CLI add-hub-package action."""
+    from brix.modules.dbt.project.editor import PackageAlreadyExistsError, add_hub_package, load_packages, save_packages
+    from brix.modules.dbt.project.models import PackageNameError, validate_hub_package_name
+    from brix.modules.dbt.project.service import get_package_version
+
+    if not package:
+        typer.echo("--package is required for add-hub-package action", err=True)
+        return 1
+    try:
+        resolved = _resolve_package_name(package) if "/" not in package else package
+        validate_hub_package_name(resolved)
+        ver = package_version or get_package_version(resolved)
+        pkgs = load_packages(project_path)
+        pkgs = add_hub_package(pkgs, resolved, ver)
+        save_packages(pkgs, project_path)
+        typer.echo(f"Added hub package: {resolved} ({ver})")
+    except (PackageNameError, PackageAlreadyExistsError) as e:
+        typer.echo(str(e), err=True)
+        return 1
+
+    return 0
 
 
-def _cli_package_action(  # noqa: C901
+def _cli_add_git_package(
     project_path: Path,
-    action: EditActionType,
     package: str | None,
-    package_version: str | None,
     revision: str | None,
     subdirectory: str | None,
-) -> None:
-    """Handle CLI package actions."""
+) -> int:
+    """Handle CLI add-git-package action."""
+    from brix.modules.dbt.project.editor import PackageAlreadyExistsError, add_git_package, load_packages, save_packages
+
+    if not package or not revision:
+        typer.echo("--package (git URL) and --revision required for add-git-package", err=True)
+        return 1
+    try:
+        pkgs = load_packages(project_path)
+        pkgs = add_git_package(pkgs, package, revision, subdirectory)
+        save_packages(pkgs, project_path)
+        typer.echo(f"Added git package: {package} ({revision})")
+    except PackageAlreadyExistsError as e:
+        typer.echo(str(e), err=True)
+        return 1
+
+    return 0
+
+
+def _cli_add_local_package(project_path: Path, package: str | None) -> int:
+    """Handle CLI add-local-package action."""
     from brix.modules.dbt.project.editor import (
         PackageAlreadyExistsError,
-        PackageNotFoundError,
-        add_git_package,
-        add_hub_package,
         add_local_package,
         load_packages,
-        remove_package,
+        save_packages,
+    )
+
+    if not package:
+        typer.echo("--package (local path) is required for add-local-package action", err=True)
+        return 1
+    try:
+        pkgs = load_packages(project_path)
+        pkgs = add_local_package(pkgs, package)
+        save_packages(pkgs, project_path)
+        typer.echo(f"Added local package: {package}")
+    except PackageAlreadyExistsError as e:
+        typer.echo(str(e), err=True)
+        return 1
+
+    return 0
+
+
+def _cli_remove_package(project_path: Path, package: str | None) -> int:
+    """Handle CLI remove-package action."""
+    from brix.modules.dbt.project.editor import PackageNotFoundError, load_packages, remove_package, save_packages
+
+    if not package:
+        typer.echo("--package is required for remove-package action", err=True)
+        return 1
+    try:
+        pkgs = load_packages(project_path)
+        pkgs = remove_package(pkgs, package)
+        save_packages(pkgs, project_path)
+        typer.echo(f"Removed package: {package}")
+    except PackageNotFoundError as e:
+        typer.echo(str(e), err=True)
+        return 1
+
+    return 0
+
+
+def _cli_update_package_version(project_path: Path, package: str | None, package_version: str | None) -> int:
+    """Handle CLI update-package-version action."""
+    from brix.modules.dbt.project.editor import (
+        PackageNotFoundError,
+        load_packages,
         save_packages,
         update_package_version,
     )
 
+    if not package or not package_version:
+        typer.echo("--package and --package-version required for update-package-version", err=True)
+        return 1
+    try:
+        pkgs = load_packages(project_path)
+        pkgs = update_package_version(pkgs, package, package_version)
+        save_packages(pkgs, project_path)
+        typer.echo(f"Updated {package} to version {package_version}")
+    except (PackageNotFoundError, ValueError) as e:
+        typer.echo(str(e), err=True)
+        return 1
+
+    return 0
+
+
+def _run_cli_package_action(
+    action: EditActionType,
+    project_path: Path,
+    package: str | None,
+    package_version: str | None,
+    revision: str | None,
+    subdirectory: str | None,
+) -> int:
+    """Execute a CLI package action.
+
+    Returns:
+        Process exit code (0 on success)
+    """
     if action == "add-hub-package":
-        if not package:
-            typer.echo("--package is required for add-hub-package action", err=True)
-            raise typer.Exit(1)
-        try:
-            resolved = _resolve_package_name(package) if "/" not in package else package
-            validate_hub_package_name(resolved)
-            ver = package_version or get_package_version(resolved)
-            pkgs = load_packages(project_path)
-            pkgs = add_hub_package(pkgs, resolved, ver)
-            save_packages(pkgs, project_path)
-            typer.echo(f"Added hub package: {resolved} ({ver})")
-        except PackageNameError as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1) from None
-        except PackageAlreadyExistsError as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1) from None
-
-    elif action == "add-git-package":
-        if not package or not revision:
-            typer.echo("--package (git URL) and --revision required for add-git-package", err=True)
-            raise typer.Exit(1)
-        try:
-            pkgs = load_packages(project_path)
-            pkgs = add_git_package(pkgs, package, revision, subdirectory)
-            save_packages(pkgs, project_path)
-            typer.echo(f"Added git package: {package} ({revision})")
-        except PackageAlreadyExistsError as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1) from None
-
-    elif action == "add-local-package":
-        if not package:
-            typer.echo("--package (local path) is required for add-local-package action", err=True)
-            raise typer.Exit(1)
-        try:
-            pkgs = load_packages(project_path)
-            pkgs = add_local_package(pkgs, package)
-            save_packages(pkgs, project_path)
-            typer.echo(f"Added local package: {package}")
-        except PackageAlreadyExistsError as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1) from None
-
-    elif action == "remove-package":
-        if not package:
-            typer.echo("--package is required for remove-package action", err=True)
-            raise typer.Exit(1)
-        try:
-            pkgs = load_packages(project_path)
-            pkgs = remove_package(pkgs, package)
-            save_packages(pkgs, project_path)
-            typer.echo(f"Removed package: {package}")
-        except PackageNotFoundError as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1) from None
-
-    elif action == "update-package-version":
-        if not package or not package_version:
-            typer.echo("--package and --package-version required for update-package-version", err=True)
-            raise typer.Exit(1)
-        try:
-            pkgs = load_packages(project_path)
-            pkgs = update_package_version(pkgs, package, package_version)
-            save_packages(pkgs, project_path)
-            typer.echo(f"Updated {package} to version {package_version}")
-        except (PackageNotFoundError, ValueError) as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1) from None
+        return _cli_add_hub_package(project_path, package, package_version)
+    if action == "add-git-package":
+        return _cli_add_git_package(project_path, package, revision, subdirectory)
+    if action == "add-local-package":
+        return _cli_add_local_package(project_path, package)
+    if action == "remove-package":
+        return _cli_remove_package(project_path, package)
+    return _cli_update_package_version(project_path, package, package_version)
 
 
 def _run_cli_edit_action(
@@ -480,12 +538,16 @@ def _run_cli_edit_action(
     revision: str | None,
     subdirectory: str | None,
     force: bool,
-) -> None:
-    """Execute a CLI edit action."""
+) -> int:
+    """Execute a CLI edit action.
+
+    Returns:
+        Process exit code (0 on success)
+    """
     logger = get_logger()
 
     if action == "set-name":
-        _cli_set_project_field(
+        code = _cli_set_project_field(
             project_path,
             "name",
             name,
@@ -493,7 +555,7 @@ def _run_cli_edit_action(
             "Updated project name to '{value}'",
         )
     elif action == "set-profile":
-        _cli_set_project_field(
+        code = _cli_set_project_field(
             project_path,
             "profile",
             profile_name,
@@ -501,7 +563,7 @@ def _run_cli_edit_action(
             "Updated profile to '{value}'",
         )
     elif action == "set-version":
-        _cli_set_project_field(
+        code = _cli_set_project_field(
             project_path,
             "version",
             version,
@@ -509,13 +571,15 @@ def _run_cli_edit_action(
             "Updated version to '{value}'",
         )
     elif action == "set-require-dbt-version":
-        _cli_set_require_dbt_version(project_path, require_dbt_version)
-    elif action in ("add-path", "remove-path"):
-        _cli_path_action(project_path, action, path_field, path_value, create_dir)
+        code = _cli_set_require_dbt_version(project_path, require_dbt_version)
+    elif action in _PATH_ACTIONS:
+        code = _cli_path_action(project_path, action, path_field, path_value, create_dir)
     else:
-        _cli_package_action(project_path, action, package, package_version, revision, subdirectory)
+        code = _run_cli_package_action(action, project_path, package, package_version, revision, subdirectory)
 
-    logger.debug("Completed action: %s", action)
+    if code == 0:
+        logger.debug("Completed action: %s", action)
+    return code
 
 
 @app.command()
@@ -626,6 +690,8 @@ def edit(
     """
     if action is None:
         # Interactive mode
+        from brix.modules.dbt.project.prompts import run_interactive_edit
+
         run_interactive_edit(project_path)
         return
 
@@ -638,7 +704,7 @@ def edit(
         typer.echo(f"Project file not found: {project_path}", err=True)
         raise typer.Exit(1)
 
-    _run_cli_edit_action(
+    code = _run_cli_edit_action(
         action=action,
         project_path=project_path,
         name=name,
@@ -654,3 +720,5 @@ def edit(
         subdirectory=subdirectory,
         force=force,
     )
+    if code:
+        raise typer.Exit(code)
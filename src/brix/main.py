@@ -1,25 +1,60 @@
 """Brix CLI - an exploration for Databricks."""
 
+import importlib
+import os
+import sys
 from pathlib import Path
 from typing import Annotated
 
+import click
 import typer
+from typer.core import TyperGroup
+
+# Subcommand groups imported on first lookup: name -> module exposing a Typer `app`
+_LAZY_SUBCOMMANDS = {
+    "dbt": "brix.commands.dbt",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root group that imports subcommand modules only when they are resolved."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager commands followed by lazily registered ones."""
+        commands = super().list_commands(ctx)
+        return commands + [name for name in _LAZY_SUBCOMMANDS if name not in commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Import and register a lazy subcommand group on first access."""
+        if cmd_name in _LAZY_SUBCOMMANDS and cmd_name not in self.commands:
+            module = importlib.import_module(_LAZY_SUBCOMMANDS[cmd_name])
+            command = typer.main.get_command(module.app)
+            command.name = cmd_name
+            self.add_command(command)
+        return super().get_command(ctx, cmd_name)
 
-from brix import __version__
-from brix.commands.dbt import app as dbt_app
-from brix.utils.logging import setup_logging
-from brix.version_check import check_for_updates
 
 app = typer.Typer(
+    cls=LazyGroup,
     help="Brix CLI - an exploration for Databricks.",
     context_settings={"help_option_names": ["-h", "--help"]},
 )
-app.add_typer(dbt_app, name="dbt")
+
+# Invocations that never need the update notice (help output and shell completion)
+_HELP_FLAGS = frozenset({"--help", "-h"})
+_COMPLETE_VAR = "_BRIX_COMPLETE"
+
+
+def _skip_update_check() -> bool:
+    """Return True for help and shell-completion invocations."""
+    return _COMPLETE_VAR in os.environ or not _HELP_FLAGS.isdisjoint(sys.argv[1:])
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
+        from brix import __version__
+
         typer.echo(f"brix {__version__}")
         raise typer.Exit()
 
@@ -43,14 +78,35 @@ def main(
         bool | None,
         typer.Option("--log-json/--no-log-json", help="Enable JSON log format."),
     ] = None,
+    no_version_check: Annotated[
+        bool,
+        typer.Option("--no-version-check", envvar="BRIX_NO_VERSION_CHECK", help="Disable the update check."),
+    ] = False,
 ) -> None:
     """Brix CLI entry point."""
+    # Deferred: the logging config pulls in pydantic-settings, which --version
+    # and shell completion never need
+    from brix.utils.logging import setup_logging
+
     # Initialize logging first - must happen before check_for_updates() so the
     # logger singleton is configured with CLI overrides before version_check uses it
     setup_logging(level=log_level, log_path=log_path, json_format=log_json)
 
-    # Check for updates (silent on failure)
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+        return
+
+    if no_version_check or _skip_update_check():
+        return
+
+    # Deferred so packaging and pydantic load only when the check actually runs
+    from brix.version_check import check_for_updates
+
+    # Check for updates (silent on failure). Only the cached result is read
+    # here; a stale cache is refreshed by a daemon thread for the next run.
     if latest := check_for_updates():
+        from brix import __version__
+
         typer.secho(
             f"Update available: {__version__} → {latest}\n"
             "  pip: pip install --upgrade brix\n"
@@ -58,6 +114,3 @@ def main(
             fg=typer.colors.YELLOW,
             err=True,
         )
-
-    if ctx.invoked_subcommand is None:
-        typer.echo(ctx.get_help())
@@ -1,21 +1,46 @@
-"""dbt module."""
-
-from brix.modules.dbt.passthrough import (
-    CachedPathNotFoundError,
-    load_project_cache,
-    pre_dbt_hook,
-    run_dbt,
-    save_project_cache,
-)
-from brix.modules.dbt.profile import (
-    DbtProfiles,
-    OutputAlreadyExistsError,
-    OutputNotFoundError,
-    ProfileAlreadyExistsError,
-    ProfileExistsError,
-    ProfileNotFoundError,
-    init_profile,
-)
+"""dbt module.
+
+Re-exports are resolved lazily (PEP 562) so importing this package does not
+pull in the profile and passthrough stacks until a symbol is used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from brix.modules.dbt.passthrough import (
+        CachedPathNotFoundError,
+        load_project_cache,
+        pre_dbt_hook,
+        run_dbt,
+        save_project_cache,
+    )
+    from brix.modules.dbt.profile import (
+        DbtProfiles,
+        OutputAlreadyExistsError,
+        OutputNotFoundError,
+        ProfileAlreadyExistsError,
+        ProfileExistsError,
+        ProfileNotFoundError,
+        init_profile,
+    )
+
+_LAZY_MAP: dict[str, str] = {
+    "CachedPathNotFoundError": "brix.modules.dbt.passthrough",
+    "load_project_cache": "brix.modules.dbt.passthrough",
+    "pre_dbt_hook": "brix.modules.dbt.passthrough",
+    "run_dbt": "brix.modules.dbt.passthrough",
+    "save_project_cache": "brix.modules.dbt.passthrough",
+    "DbtProfiles": "brix.modules.dbt.profile",
+    "OutputAlreadyExistsError": "brix.modules.dbt.profile",
+    "OutputNotFoundError": "brix.modules.dbt.profile",
+    "ProfileAlreadyExistsError": "brix.modules.dbt.profile",
+    "ProfileExistsError": "brix.modules.dbt.profile",
+    "ProfileNotFoundError": "brix.modules.dbt.profile",
+    "init_profile": "brix.modules.dbt.profile",
+}
 
 __all__ = [
     "CachedPathNotFoundError",
@@ -31,3 +56,20 @@ __all__ = [
     "run_dbt",
     "save_project_cache",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import re-exported symbols on first access."""
+    try:
+        module_name = _LAZY_MAP[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazy re-exports."""
+    return sorted([*globals(), *_LAZY_MAP])
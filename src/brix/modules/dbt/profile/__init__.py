@@ -1,8 +1,13 @@
 """Profile management submodule for dbt.
 
-Re-exports public API from submodules.
+Re-exports public API from submodules. ``run_interactive_edit`` is resolved
+lazily so non-interactive commands do not import questionary.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from brix.modules.dbt.profile.editor import (
     OutputAlreadyExistsError,
     OutputNotFoundError,
@@ -29,7 +34,6 @@ from brix.modules.dbt.profile.models import (
     OutputConfig,
     ProfileTarget,
 )
-from brix.modules.dbt.profile.prompts import run_interactive_edit
 from brix.modules.dbt.profile.service import (
     ProfileConfig,
     ProfileExistsError,
@@ -39,6 +43,9 @@ from brix.modules.dbt.profile.service import (
     load_template,
 )
 
+if TYPE_CHECKING:
+    from brix.modules.dbt.profile.prompts import run_interactive_edit
+
 __all__ = [  # noqa: RUF022
     # Models
     "DatabricksAuthType",
@@ -74,3 +81,14 @@ __all__ = [  # noqa: RUF022
     # Prompts
     "run_interactive_edit",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the interactive editor on first access."""
+    if name == "run_interactive_edit":
+        from brix.modules.dbt.profile.prompts import run_interactive_edit
+
+        globals()[name] = run_interactive_edit
+        return run_interactive_edit
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
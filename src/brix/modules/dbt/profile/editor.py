@@ -10,8 +10,13 @@ from typing import Any
 
 from brix.modules.dbt.profile.models import DbtProfiles, OutputConfig, ProfileTarget
 from brix.modules.dbt.profile.service import get_default_profile_path
+from brix.utils.files import write_text_if_changed
 from brix.utils.logging import get_logger
 
+# Parsed profiles keyed on (resolved path, mtime_ns, size); any write changes
+# the key, and save_profiles drops the entries for the file it writes.
+_load_cache: dict[tuple[Path, int, int], DbtProfiles] = {}
+
 
 class ProfileNotFoundError(Exception):
     """Raised when a profile does not exist."""
@@ -32,6 +37,9 @@ class OutputAlreadyExistsError(Exception):
 def load_profiles(path: Path | None = None) -> DbtProfiles:
     """Load profiles from disk.
 
+    Parsed profiles are cached per path and modification time, so reloading an
+    unchanged file skips the YAML parse. Callers get a copy and may mutate it.
+
     Args:
         path: Path to profiles.yml, uses default if None
 
@@ -44,8 +52,15 @@ def load_profiles(path: Path | None = None) -> DbtProfiles:
     """
     target_path = path or get_default_profile_path()
     logger = get_logger()
-    logger.debug("Loading profiles from %s", target_path)
-    return DbtProfiles.from_file(target_path)
+    stat = target_path.stat()
+    key = (target_path.resolve(), stat.st_mtime_ns, stat.st_size)
+    cached = _load_cache.get(key)
+    if cached is None:
+        logger.debug("Loading profiles from %s", target_path)
+        cached = _load_cache[key] = DbtProfiles.from_file(target_path)
+    else:
+        logger.debug("Using cached profiles for %s", target_path)
+    return cached.model_copy(deep=True)
 
 
 def save_profiles(profiles: DbtProfiles, path: Path | None = None) -> None:
@@ -62,18 +77,28 @@ def save_profiles(profiles: DbtProfiles, path: Path | None = None) -> None:
     target_path = path or get_default_profile_path()
     logger = get_logger()
 
-    # Validate by re-parsing (ensures YAML roundtrip is valid)
+    # Editors assign fields directly, so re-validate the dumped data in memory before writing
+    DbtProfiles.model_validate(profiles.model_dump(exclude_none=True, by_alias=True))
     yaml_content = profiles.to_yaml()
-    DbtProfiles.from_yaml(yaml_content)
 
     # Ensure parent directory exists
     target_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to disk
-    target_path.write_text(yaml_content)
+    # Write to disk (atomic, skipped when unchanged)
+    if not write_text_if_changed(target_path, yaml_content):
+        logger.debug("Profiles unchanged, not rewriting %s", target_path)
+        return
+    _invalidate_profiles_cache(target_path)
     logger.debug("Saved profiles to %s", target_path)
 
 
+def _invalidate_profiles_cache(path: Path) -> None:
+    """Drop cached parses for a profiles file."""
+    resolved = path.resolve()
+    for key in [key for key in _load_cache if key[0] == resolved]:
+        del _load_cache[key]
+
+
 def get_profile_names(profiles: DbtProfiles) -> list[str]:
     """Get list of profile names.
 
@@ -7,7 +7,7 @@ Supports DuckDB and Databricks adapters.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, BinaryIO, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing_extensions import Self
@@ -193,11 +193,11 @@ class DbtProfiles(BaseModel):
         return key in self.root
 
     @classmethod
-    def from_yaml(cls, content: str) -> DbtProfiles:
+    def from_yaml(cls, content: str | BinaryIO) -> DbtProfiles:
         """Parse profiles from YAML string.
 
         Args:
-            content: YAML string content of profiles.yml
+            content: YAML string (or binary stream) content of profiles.yml
 
         Returns:
             Parsed DbtProfiles instance
@@ -205,11 +205,11 @@ class DbtProfiles(BaseModel):
         Raises:
             ValueError: If YAML is invalid or doesn't match schema
         """
-        import yaml
+        from brix.utils.yaml_io import YAMLError, load_yaml
 
         try:
-            data = yaml.safe_load(content)
-        except yaml.YAMLError as e:
+            data = load_yaml(content)
+        except YAMLError as e:
             msg = f"Invalid YAML: {e}"
             raise ValueError(msg) from e
 
@@ -233,8 +233,9 @@ class DbtProfiles(BaseModel):
             FileNotFoundError: If file doesn't exist
             ValueError: If YAML is invalid or doesn't match schema
         """
-        content = path.read_text()
-        return cls.from_yaml(content)
+        # Hand libyaml the binary stream so it decodes while parsing
+        with path.open("rb") as stream:
+            return cls.from_yaml(stream)
 
     def to_yaml(self) -> str:
         """Serialize profiles to YAML string.
@@ -242,9 +243,9 @@ class DbtProfiles(BaseModel):
         Returns:
             YAML string representation
         """
-        import yaml
+        from brix.utils.yaml_io import dump_yaml
 
         # Convert to dict, handling nested models
         # Use by_alias=True to output 'schema' instead of 'schema_'
         data = {name: profile.model_dump(exclude_none=True, by_alias=True) for name, profile in self.root.items()}
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        return dump_yaml(data)
@@ -6,8 +6,11 @@ Supports both DuckDB and Databricks adapter configurations.
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import questionary
 import typer
@@ -56,6 +59,72 @@ AdapterType = Literal["duckdb", "databricks"]
 # Databricks authentication methods
 DatabricksAuthMethod = Literal["token", "oauth_u2m", "oauth_m2m_aws", "oauth_m2m_azure"]
 
+# key=value setting (key must not be blank) and comma/space separated extension names
+_SETTING_RE = re.compile(r"^\s*([^=\s][^=]*?)\s*=\s*(.*?)\s*$")
+_EXTENSION_RE = re.compile(r"[^,\s]+")
+
+# Menu choices, built once and reused across prompts
+_ADAPTER_CHOICES = (
+    questionary.Choice("DuckDB (local/in-memory database)", value="duckdb"),
+    questionary.Choice("Databricks (cloud data platform)", value="databricks"),
+)
+
+_DATABRICKS_AUTH_CHOICES = (
+    questionary.Choice("Personal Access Token (PAT)", value="token"),
+    questionary.Choice("OAuth U2M (browser login)", value="oauth_u2m"),
+    questionary.Choice("OAuth M2M - AWS/GCP (client credentials)", value="oauth_m2m_aws"),
+    questionary.Choice("OAuth M2M - Azure (client credentials)", value="oauth_m2m_azure"),
+)
+
+_MAIN_CHOICES = (
+    questionary.Choice("Add a new profile", value="add_profile"),
+    questionary.Choice("Edit an existing profile", value="edit_profile"),
+    questionary.Choice("Delete a profile", value="delete_profile"),
+    questionary.Choice("Add an output to a profile", value="add_output"),
+    questionary.Choice("Edit an output", value="edit_output"),
+    questionary.Choice("Delete an output", value="delete_output"),
+    questionary.Choice("Exit", value="exit"),
+)
+
+_PROFILE_ACTION_CHOICES = (
+    questionary.Choice("Edit target", value="target"),
+    questionary.Choice("Edit an output", value="edit_output"),
+    questionary.Choice("Back to main menu", value="back"),
+)
+
+_DUCKDB_OUTPUT_ACTION_CHOICES = (
+    questionary.Choice("Edit path", value="path"),
+    questionary.Choice("Edit schema", value="schema"),
+    questionary.Choice("Edit database", value="database"),
+    questionary.Choice("Edit threads", value="threads"),
+    questionary.Choice("Edit extensions", value="extensions"),
+    questionary.Choice("Edit settings", value="settings"),
+    questionary.Choice("Back to profile menu", value="back"),
+)
+
+_DATABRICKS_OUTPUT_ACTION_CHOICES = (
+    questionary.Choice("Edit host", value="host"),
+    questionary.Choice("Edit HTTP path", value="http_path"),
+    questionary.Choice("Edit schema", value="schema"),
+    questionary.Choice("Edit catalog", value="catalog"),
+    questionary.Choice("Edit token", value="token"),
+    questionary.Choice("Edit threads", value="threads"),
+    questionary.Choice("Back to profile menu", value="back"),
+)
+
+_EXTENSIONS_ACTION_CHOICES = (
+    questionary.Choice("Replace all", value="replace"),
+    questionary.Choice("Clear all", value="clear"),
+    questionary.Choice("Cancel", value="cancel"),
+)
+
+_SETTINGS_ACTION_CHOICES = (
+    questionary.Choice("Add/update a setting", value="add"),
+    questionary.Choice("Remove a setting", value="remove"),
+    questionary.Choice("Clear all settings", value="clear"),
+    questionary.Choice("Cancel", value="cancel"),
+)
+
 
 def prompt_adapter_type() -> AdapterType | None:
     """Prompt user to select adapter type.
@@ -63,11 +132,7 @@ def prompt_adapter_type() -> AdapterType | None:
     Returns:
         Selected adapter type, or None if cancelled
     """
-    choices = [
-        questionary.Choice("DuckDB (local/in-memory database)", value="duckdb"),
-        questionary.Choice("Databricks (cloud data platform)", value="databricks"),
-    ]
-    return questionary.select("Select adapter type:", choices=choices).ask()
+    return questionary.select("Select adapter type:", choices=_ADAPTER_CHOICES).ask()
 
 
 def prompt_databricks_auth_method() -> DatabricksAuthMethod | None:
@@ -76,20 +141,12 @@ def prompt_databricks_auth_method() -> DatabricksAuthMethod | None:
     Returns:
         Selected auth method, or None if cancelled
     """
-    choices = [
-        questionary.Choice("Personal Access Token (PAT)", value="token"),
-        questionary.Choice("OAuth U2M (browser login)", value="oauth_u2m"),
-        questionary.Choice("OAuth M2M - AWS/GCP (client credentials)", value="oauth_m2m_aws"),
-        questionary.Choice("OAuth M2M - Azure (client credentials)", value="oauth_m2m_azure"),
-    ]
-    return questionary.select("Select authentication method:", choices=choices).ask()
+    return questionary.select("Select authentication method:", choices=_DATABRICKS_AUTH_CHOICES).ask()
 
 
 def _parse_extensions(input_str: str) -> list[str]:
     """Parse comma-separated extensions string into list."""
-    if not input_str.strip():
-        return []
-    return [ext.strip() for ext in input_str.split(",") if ext.strip()]
+    return _EXTENSION_RE.findall(input_str)
 
 
 def _parse_setting(input_str: str) -> tuple[str, str] | None:
@@ -98,31 +155,45 @@ def _parse_setting(input_str: str) -> tuple[str, str] | None:
     Returns:
         Tuple of (key, value) or None if invalid format
     """
-    if "=" not in input_str:
-        return None
-    key, _, value = input_str.partition("=")
-    key = key.strip()
-    value = value.strip()
-    if not key:
+    match = _SETTING_RE.match(input_str)
+    return (match.group(1), match.group(2)) if match else None
+
+
+def _validate_required(value: str) -> bool | str:
+    """Reject empty input for required form fields."""
+    return bool(value.strip()) or "This field is required"
+
+
+def _prompt_form(**questions: questionary.Question) -> dict[str, str] | None:
+    """Ask several text questions as a single form.
+
+    Returns:
+        Answers keyed by question name, or None if cancelled
+    """
+    answers = questionary.form(**questions).ask()
+    if not answers or any(answer is None for answer in answers.values()):
         return None
-    return (key, value)
+    return answers
 
 
-def _prompt_settings_loop() -> dict[str, str]:
-    """Prompt for settings as key=value pairs until empty input."""
+def _prompt_settings() -> dict[str, str]:
+    """Prompt for settings as key=value pairs, one per line."""
     settings: dict[str, str] = {}
-    typer.echo("Enter settings as key=value pairs (empty to finish):")
-    while True:
-        setting_str = questionary.text("  Setting:").ask()
-        if setting_str is None or not setting_str.strip():
-            break
-        parsed = _parse_setting(setting_str)
+    settings_str = questionary.text(
+        "Settings:",
+        multiline=True,
+        instruction="One key=value per line, Esc+Enter to finish",
+    ).ask()
+    for line in (settings_str or "").splitlines():
+        if not line.strip():
+            continue
+        parsed = _parse_setting(line)
         if parsed:
             key, value = parsed
             settings[key] = value
             typer.echo(f"    Added: {key}={value}")
         else:
-            typer.echo("    Invalid format, use key=value", err=True)
+            typer.echo(f"    Invalid format, use key=value: {line.strip()}", err=True)
     return settings
 
 
@@ -134,36 +205,35 @@ def prompt_duckdb_output_details() -> DuckDbOutput | None:
     """
     typer.echo("\n[DuckDB Configuration]")
 
-    path = questionary.text(
-        "Database path:",
-        default=":memory:",
-        instruction="Use ':memory:' for in-memory database or a file path",
-    ).ask()
-    if path is None:
-        return None
-
-    schema = questionary.text(
-        "Schema:",
-        default="main",
-        instruction="Default schema for models",
-    ).ask()
-    if schema is None:
-        return None
-
-    database = questionary.text(
-        "Database:",
-        default="main",
-        instruction="Database name (usually 'main')",
-    ).ask()
-    if database is None:
-        return None
-
-    threads_str = questionary.text("Thread count:", default="1").ask()
-    if threads_str is None:
+    answers = _prompt_form(
+        path=questionary.text(
+            "Database path:",
+            default=":memory:",
+            instruction="Use ':memory:' for in-memory database or a file path",
+        ),
+        schema=questionary.text(
+            "Schema:",
+            default="main",
+            instruction="Default schema for models",
+        ),
+        database=questionary.text(
+            "Database:",
+            default="main",
+            instruction="Database name (usually 'main')",
+        ),
+        threads=questionary.text("Thread count:", default="1"),
+        extensions=questionary.text(
+            "Extensions (optional):",
+            default="",
+            instruction="Comma-separated list (e.g., httpfs,parquet) or leave empty",
+        ),
+    )
+    if answers is None:
         return None
+    path, schema, database = answers["path"], answers["schema"], answers["database"]
 
     try:
-        threads = int(threads_str)
+        threads = int(answers["threads"])
         if threads < 1:
             typer.echo("Invalid thread count, using 1", err=True)
             threads = 1
@@ -171,23 +241,14 @@ def prompt_duckdb_output_details() -> DuckDbOutput | None:
         typer.echo("Invalid thread count, using 1", err=True)
         threads = 1
 
-    # Extensions (optional)
-    typer.echo("\nOptional: DuckDB Extensions")
-    extensions_str = questionary.text(
-        "Extensions:",
-        default="",
-        instruction="Comma-separated list (e.g., httpfs,parquet) or leave empty",
-    ).ask()
-    if extensions_str is None:
-        return None
-    extensions = _parse_extensions(extensions_str)
+    extensions = _parse_extensions(answers["extensions"])
 
     # Settings (optional)
     typer.echo("\nOptional: DuckDB Settings")
     add_settings = questionary.confirm("Add custom settings?", default=False).ask()
     if add_settings is None:
         return None
-    settings = _prompt_settings_loop() if add_settings else {}
+    settings = _prompt_settings() if add_settings else {}
 
     return DuckDbOutput(
         type="duckdb",
@@ -209,33 +270,33 @@ def _prompt_databricks_connection() -> tuple[str, str, str, str | None] | None:
     typer.echo("\n[Databricks Configuration]")
     typer.echo("Required connection settings:")
 
-    host = questionary.text(
-        "Host:",
-        instruction="e.g., myorg.databricks.com (without https://)",
-    ).ask()
-    if not host:
-        return None
-
-    http_path = questionary.text(
-        "HTTP path:",
-        instruction="e.g., /sql/1.0/warehouses/abc123",
-    ).ask()
-    if not http_path:
-        return None
-
-    schema = questionary.text(
-        "Schema:",
-        instruction="The default schema for your models",
-    ).ask()
-    if not schema:
+    answers = _prompt_form(
+        host=questionary.text(
+            "Host:",
+            instruction="e.g., myorg.databricks.com (without https://)",
+            validate=_validate_required,
+        ),
+        http_path=questionary.text(
+            "HTTP path:",
+            instruction="e.g., /sql/1.0/warehouses/abc123",
+            validate=_validate_required,
+        ),
+        schema=questionary.text(
+            "Schema:",
+            instruction="The default schema for your models",
+            validate=_validate_required,
+        ),
+        catalog=questionary.text(
+            "Catalog (optional):",
+            default="",
+            instruction="Leave empty if not using Unity Catalog",
+        ),
+    )
+    if answers is None:
         return None
-
-    catalog = questionary.text(
-        "Catalog (optional):",
-        default="",
-        instruction="Leave empty if not using Unity Catalog",
-    ).ask()
-    if catalog is None:
+    host, http_path, schema, catalog = answers["host"], answers["http_path"], answers["schema"], answers["catalog"]
+    if not host or not http_path or not schema:
+        typer.echo("Host, HTTP path and schema are required", err=True)
         return None
 
     return (host, http_path, schema, catalog or None)
@@ -334,6 +395,12 @@ def prompt_databricks_output_details() -> DatabricksOutput | None:
     )
 
 
+_ADAPTER_BUILDERS: dict[AdapterType, Callable[[], OutputConfig | None]] = {
+    "duckdb": prompt_duckdb_output_details,
+    "databricks": prompt_databricks_output_details,
+}
+
+
 def prompt_output_config() -> OutputConfig | None:
     """Prompt user for output configuration (adapter selection + details).
 
@@ -344,10 +411,7 @@ def prompt_output_config() -> OutputConfig | None:
     if adapter_type is None:
         return None
 
-    if adapter_type == "duckdb":
-        return prompt_duckdb_output_details()
-    else:
-        return prompt_databricks_output_details()
+    return _ADAPTER_BUILDERS[adapter_type]()
 
 
 def prompt_main_action() -> MainAction:
@@ -356,16 +420,7 @@ def prompt_main_action() -> MainAction:
     Returns:
         Selected action
     """
-    choices = [
-        questionary.Choice("Add a new profile", value="add_profile"),
-        questionary.Choice("Edit an existing profile", value="edit_profile"),
-        questionary.Choice("Delete a profile", value="delete_profile"),
-        questionary.Choice("Add an output to a profile", value="add_output"),
-        questionary.Choice("Edit an output", value="edit_output"),
-        questionary.Choice("Delete an output", value="delete_output"),
-        questionary.Choice("Exit", value="exit"),
-    ]
-    result = questionary.select("What would you like to do?", choices=choices).ask()
+    result = questionary.select("What would you like to do?", choices=_MAIN_CHOICES).ask()
     if result is None:
         return "exit"
     return result
@@ -417,12 +472,7 @@ def prompt_profile_action() -> ProfileAction:
     Returns:
         Selected action
     """
-    choices = [
-        questionary.Choice("Edit target", value="target"),
-        questionary.Choice("Edit an output", value="edit_output"),
-        questionary.Choice("Back to main menu", value="back"),
-    ]
-    result = questionary.select("What would you like to edit?", choices=choices).ask()
+    result = questionary.select("What would you like to edit?", choices=_PROFILE_ACTION_CHOICES).ask()
     if result is None:
         return "back"
     return result
@@ -434,16 +484,7 @@ def prompt_duckdb_output_action() -> DuckDbOutputAction:
     Returns:
         Selected action
     """
-    choices = [
-        questionary.Choice("Edit path", value="path"),
-        questionary.Choice("Edit schema", value="schema"),
-        questionary.Choice("Edit database", value="database"),
-        questionary.Choice("Edit threads", value="threads"),
-        questionary.Choice("Edit extensions", value="extensions"),
-        questionary.Choice("Edit settings", value="settings"),
-        questionary.Choice("Back to profile menu", value="back"),
-    ]
-    result = questionary.select("What would you like to edit?", choices=choices).ask()
+    result = questionary.select("What would you like to edit?", choices=_DUCKDB_OUTPUT_ACTION_CHOICES).ask()
     if result is None:
         return "back"
     return result
@@ -455,16 +496,7 @@ def prompt_databricks_output_action() -> DatabricksOutputAction:
     Returns:
         Selected action
     """
-    choices = [
-        questionary.Choice("Edit host", value="host"),
-        questionary.Choice("Edit HTTP path", value="http_path"),
-        questionary.Choice("Edit schema", value="schema"),
-        questionary.Choice("Edit catalog", value="catalog"),
-        questionary.Choice("Edit token", value="token"),
-        questionary.Choice("Edit threads", value="threads"),
-        questionary.Choice("Back to profile menu", value="back"),
-    ]
-    result = questionary.select("What would you like to edit?", choices=choices).ask()
+    result = questionary.select("What would you like to edit?", choices=_DATABRICKS_OUTPUT_ACTION_CHOICES).ask()
     if result is None:
         return "back"
     return result
@@ -629,23 +661,24 @@ def _handle_delete_output(profiles: DbtProfiles, profile_path: Path) -> DbtProfi
     if output_name is None:
         return profiles
 
+    # A sole output that is also the target cannot be deleted; fail before asking to confirm
+    profile = profiles.root[profile_name]
+    is_target = profile.target == output_name
+    if is_target and len(profile.outputs) < 2:
+        typer.echo(
+            f"Cannot delete output '{output_name}' - it is the current target and no other outputs exist.",
+            err=True,
+        )
+        return profiles
+
     if not prompt_confirm_delete(f"output '{output_name}' from profile '{profile_name}'"):
         typer.echo("Cancelled")
         return profiles
 
-    # Check if deleting the current target
-    profile = profiles.root[profile_name]
     new_target: str | None = None
-    if profile.target == output_name:
-        other_outputs = [name for name in profile.outputs if name != output_name]
-        if not other_outputs:
-            typer.echo(
-                f"Cannot delete output '{output_name}' - it is the current target and no other outputs exist.",
-                err=True,
-            )
-            return profiles
-
+    if is_target:
         typer.echo(f"Output '{output_name}' is the current target. Select a new target:")
+        other_outputs = [name for name in profile.outputs if name != output_name]
         new_target = questionary.select("New target:", choices=other_outputs).ask()
         if new_target is None:
             typer.echo("Cancelled")
@@ -664,82 +697,102 @@ def _handle_delete_output(profiles: DbtProfiles, profile_path: Path) -> DbtProfi
     return profiles
 
 
-def _update_output_path(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, current_path: str
-) -> DbtProfiles:
+@dataclass
+class ProfileSession:
+    """Buffers profile edits made in a submenu and saves them once.
+
+    Used as a context manager: pending edits are flushed on exit, including
+    when the submenu is left via Ctrl+C. A failed save is reported and the
+    edits stay pending, so a later flush can retry.
+    """
+
+    profiles: DbtProfiles
+    profile_path: Path
+    dirty: bool = False
+
+    def mark_dirty(self) -> None:
+        """Record that profiles changed and need saving."""
+        self.dirty = True
+
+    def flush(self) -> None:
+        """Save profiles to disk if there are pending edits."""
+        if self.dirty:
+            save_profiles(self.profiles, self.profile_path)
+            self.dirty = False
+
+    def __enter__(self) -> ProfileSession:
+        """Enter the session."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flush pending edits on exit, reporting save errors instead of raising."""
+        try:
+            self.flush()
+        except (OSError, ValueError) as e:
+            typer.echo(f"Error: {e}", err=True)
+
+
+def _update_output_path(session: ProfileSession, profile_name: str, output_name: str, current_path: str) -> None:
     """Prompt and update output path."""
     new_path = questionary.text("Enter new path:", default=current_path).ask()
     if new_path is not None:
         try:
-            profiles = update_output(profiles, profile_name, output_name, path=new_path)
-            save_profiles(profiles, profile_path)
+            update_output(session.profiles, profile_name, output_name, path=new_path)
+            session.mark_dirty()
             typer.echo(f"Updated path to '{new_path}'")
         except (ProfileNotFoundError, OutputNotFoundError) as e:
             typer.echo(str(e), err=True)
-    return profiles
 
 
-def _update_output_threads(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, current_threads: int
-) -> DbtProfiles:
+def _update_output_threads(session: ProfileSession, profile_name: str, output_name: str, current_threads: int) -> None:
     """Prompt and update output threads."""
     threads_str = questionary.text("Enter new thread count:", default=str(current_threads)).ask()
     if threads_str is not None:
         try:
             threads = int(threads_str)
-            profiles = update_output(profiles, profile_name, output_name, threads=threads)
-            save_profiles(profiles, profile_path)
+            update_output(session.profiles, profile_name, output_name, threads=threads)
+            session.mark_dirty()
             typer.echo(f"Updated threads to {threads}")
         except ValueError:
             typer.echo("Invalid thread count", err=True)
         except (ProfileNotFoundError, OutputNotFoundError) as e:
             typer.echo(str(e), err=True)
-    return profiles
 
 
-def _update_duckdb_schema(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, current_schema: str
-) -> DbtProfiles:
+def _update_duckdb_schema(session: ProfileSession, profile_name: str, output_name: str, current_schema: str) -> None:
     """Prompt and update DuckDB schema."""
     new_schema = questionary.text("Enter new schema:", default=current_schema).ask()
     if new_schema is not None and new_schema:
         try:
-            profiles = update_output_fields(profiles, profile_name, output_name, {"schema_": new_schema})
-            save_profiles(profiles, profile_path)
+            update_output_fields(session.profiles, profile_name, output_name, {"schema_": new_schema})
+            session.mark_dirty()
             typer.echo(f"Updated schema to '{new_schema}'")
         except (ProfileNotFoundError, OutputNotFoundError) as e:
             typer.echo(str(e), err=True)
-    return profiles
 
 
 def _update_duckdb_database(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, current_database: str
-) -> DbtProfiles:
+    session: ProfileSession, profile_name: str, output_name: str, current_database: str
+) -> None:
     """Prompt and update DuckDB database."""
     new_database = questionary.text("Enter new database:", default=current_database).ask()
     if new_database is not None and new_database:
         try:
-            profiles = update_output_fields(profiles, profile_name, output_name, {"database": new_database})
-            save_profiles(profiles, profile_path)
+            update_output_fields(session.profiles, profile_name, output_name, {"database": new_database})
+            session.mark_dirty()
             typer.echo(f"Updated database to '{new_database}'")
         except (ProfileNotFoundError, OutputNotFoundError) as e:
             typer.echo(str(e), err=True)
-    return profiles
 
 
 def _update_duckdb_extensions(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, current_extensions: list[str]
-) -> DbtProfiles:
+    session: ProfileSession, profile_name: str, output_name: str, current_extensions: list[str]
+) -> None:
     """Prompt and update DuckDB extensions."""
     current_str = ",".join(current_extensions) if current_extensions else ""
     typer.echo(f"Current extensions: {current_str or '(none)'}")
 
-    choices = [
-        questionary.Choice("Replace all", value="replace"),
-        questionary.Choice("Clear all", value="clear"),
-        questionary.Choice("Cancel", value="cancel"),
-    ]
-    action = questionary.select("What would you like to do?", choices=choices).ask()
+    action = questionary.select("What would you like to do?", choices=_EXTENSIONS_ACTION_CHOICES).ask()
 
     if action == "replace":
         new_extensions_str = questionary.text(
@@ -750,80 +803,74 @@ def _update_duckdb_extensions(
         if new_extensions_str is not None:
             new_extensions = _parse_extensions(new_extensions_str)
             try:
-                profiles = update_output_fields(profiles, profile_name, output_name, {"extensions": new_extensions})
-                save_profiles(profiles, profile_path)
+                update_output_fields(session.profiles, profile_name, output_name, {"extensions": new_extensions})
+                session.mark_dirty()
                 typer.echo(f"Updated extensions to: {','.join(new_extensions) or '(none)'}")
             except (ProfileNotFoundError, OutputNotFoundError) as e:
                 typer.echo(str(e), err=True)
     elif action == "clear":
         try:
-            profiles = update_output_fields(profiles, profile_name, output_name, {"extensions": []})
-            save_profiles(profiles, profile_path)
+            update_output_fields(session.profiles, profile_name, output_name, {"extensions": []})
+            session.mark_dirty()
             typer.echo("Cleared all extensions")
         except (ProfileNotFoundError, OutputNotFoundError) as e:
             typer.echo(str(e), err=True)
 
-    return profiles
-
 
 def _add_duckdb_setting(
-    profiles: DbtProfiles,
-    profile_path: Path,
+    session: ProfileSession,
     profile_name: str,
     output_name: str,
     current_settings: dict[str, str],
-) -> DbtProfiles:
+) -> None:
     """Add or update a single DuckDB setting."""
     setting_str = questionary.text("Enter setting (key=value):").ask()
     if not setting_str:
-        return profiles
+        return
 
     parsed = _parse_setting(setting_str)
     if not parsed:
         typer.echo("Invalid format, use key=value", err=True)
-        return profiles
+        return
 
     key, value = parsed
     new_settings = dict(current_settings)
     new_settings[key] = value
     try:
-        profiles = update_output_fields(profiles, profile_name, output_name, {"settings": new_settings})
-        save_profiles(profiles, profile_path)
+        update_output_fields(session.profiles, profile_name, output_name, {"settings": new_settings})
+        session.mark_dirty()
         typer.echo(f"Added setting: {key}={value}")
     except (ProfileNotFoundError, OutputNotFoundError) as e:
         typer.echo(str(e), err=True)
-    return profiles
 
 
 def _remove_duckdb_setting(
-    profiles: DbtProfiles,
-    profile_path: Path,
+    session: ProfileSession,
     profile_name: str,
     output_name: str,
     current_settings: dict[str, str],
-) -> DbtProfiles:
+) -> None:
     """Remove a single DuckDB setting."""
     if not current_settings:
         typer.echo("No settings to remove", err=True)
-        return profiles
+        return
 
     key_to_remove = questionary.select("Select setting to remove:", choices=list(current_settings.keys())).ask()
     if not key_to_remove:
-        return profiles
+        return
 
     new_settings = {k: v for k, v in current_settings.items() if k != key_to_remove}
     try:
-        profiles = update_output_fields(profiles, profile_name, output_name, {"settings": new_settings})
-        save_profiles(profiles, profile_path)
+        update_output_fields(session.profiles, profile_name, output_name, {"settings": new_settings})
+        session.mark_dirty()
         typer.echo(f"Removed setting: {key_to_remove}")
     except (ProfileNotFoundError, OutputNotFoundError) as e:
         typer.echo(str(e), err=True)
-    return profiles
 
 
 def _update_duckdb_settings(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, current_settings: dict[str, str]
-) -> DbtProfiles:
+    session: ProfileSession, profile_name: str, output_name: str, current_settings: dict[str, str]
+) -> None:
     """Prompt and update DuckDB settings."""
     if current_settings:
         typer.echo("Current settings:")
@@ -832,28 +879,20 @@ def _update_duckdb_settings(
     else:
         typer.echo("Current settings: (none)")
 
-    choices = [
-        questionary.Choice("Add/update a setting", value="add"),
-        questionary.Choice("Remove a setting", value="remove"),
-        questionary.Choice("Clear all settings", value="clear"),
-        questionary.Choice("Cancel", value="cancel"),
-    ]
-    action = questionary.select("What would you like to do?", choices=choices).ask()
+    action = questionary.select("What would you like to do?", choices=_SETTINGS_ACTION_CHOICES).ask()
 
     if action == "add":
-        return _add_duckdb_setting(profiles, profile_path, profile_name, output_name, current_settings)
-    if action == "remove":
-        return _remove_duckdb_setting(profiles, profile_path, profile_name, output_name, current_settings)
-    if action == "clear":
+        _add_duckdb_setting(session, profile_name, output_name, current_settings)
+    elif action == "remove":
+        _remove_duckdb_setting(session, profile_name, output_name, current_settings)
+    elif action == "clear":
         try:
-            profiles = update_output_fields(profiles, profile_name, output_name, {"settings": {}})
-            save_profiles(profiles, profile_path)
+            update_output_fields(session.profiles, profile_name, output_name, {"settings": {}})
+            session.mark_dirty()
             typer.echo("Cleared all settings")
         except (ProfileNotFoundError, OutputNotFoundError) as e:
             typer.echo(str(e), err=True)
 
-    return profiles
-
 
 def _display_duckdb_output_status(profile_name: str, output_name: str, output: DuckDbOutput) -> None:
     """Display current DuckDB output configuration."""
@@ -871,33 +910,34 @@ def _display_duckdb_output_status(profile_name: str, output_name: str, output: D
         typer.echo("  settings: (none)")
 
 
+# DuckDB edit action -> (updater, DuckDbOutput attribute holding the current value)
+_DUCKDB_ACTIONS: dict[DuckDbOutputAction, tuple[Callable[[ProfileSession, str, str, Any], None], str]] = {
+    "path": (_update_output_path, "path"),
+    "schema": (_update_duckdb_schema, "schema_"),
+    "database": (_update_duckdb_database, "database"),
+    "threads": (_update_output_threads, "threads"),
+    "extensions": (_update_duckdb_extensions, "extensions"),
+    "settings": (_update_duckdb_settings, "settings"),
+}
+
+
 def _handle_duckdb_action(
     action: DuckDbOutputAction,
-    profiles: DbtProfiles,
-    profile_path: Path,
+    session: ProfileSession,
     profile_name: str,
     output_name: str,
     output: DuckDbOutput,
-) -> DbtProfiles:
+) -> None:
     """Handle a single DuckDB edit action."""
-    if action == "path":
-        return _update_output_path(profiles, profile_path, profile_name, output_name, output.path)
-    if action == "schema":
-        return _update_duckdb_schema(profiles, profile_path, profile_name, output_name, output.schema_)
-    if action == "database":
-        return _update_duckdb_database(profiles, profile_path, profile_name, output_name, output.database)
-    if action == "threads":
-        return _update_output_threads(profiles, profile_path, profile_name, output_name, output.threads)
-    if action == "extensions":
-        return _update_duckdb_extensions(profiles, profile_path, profile_name, output_name, output.extensions)
-    if action == "settings":
-        return _update_duckdb_settings(profiles, profile_path, profile_name, output_name, output.settings)
-    return profiles
+    entry = _DUCKDB_ACTIONS.get(action)
+    if entry:
+        updater, attribute = entry
+        updater(session, profile_name, output_name, getattr(output, attribute))
 
 
 def _edit_duckdb_output_loop(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, output: DuckDbOutput
-) -> DbtProfiles:
+    session: ProfileSession, profile_name: str, output_name: str, output: DuckDbOutput
+) -> None:
     """DuckDB output editing submenu loop."""
     while True:
         _display_duckdb_output_status(profile_name, output_name, output)
@@ -906,56 +946,49 @@ def _edit_duckdb_output_loop(
         if action == "back":
             break
 
-        profiles = _handle_duckdb_action(action, profiles, profile_path, profile_name, output_name, output)
+        _handle_duckdb_action(action, session, profile_name, output_name, output)
 
         # Refresh output reference
         try:
-            output = get_output(profiles, profile_name, output_name)  # type: ignore[assignment]
+            output = get_output(session.profiles, profile_name, output_name)  # type: ignore[assignment]
         except (ProfileNotFoundError, OutputNotFoundError):
             break
 
-    return profiles
+
+# Databricks text field action -> (prompt, DatabricksOutput attribute, whether empty input clears the field)
+_DATABRICKS_TEXT_FIELDS: dict[str, tuple[str, str, bool]] = {
+    "host": ("Enter new host:", "host", False),
+    "http_path": ("Enter new HTTP path:", "http_path", False),
+    "schema": ("Enter new schema:", "schema_", False),
+    "catalog": ("Enter new catalog (empty to clear):", "catalog", True),
+}
 
 
 def _handle_databricks_action(
     action: DatabricksOutputAction,
-    profiles: DbtProfiles,
-    profile_path: Path,
+    session: ProfileSession,
     profile_name: str,
     output_name: str,
     output: DatabricksOutput,
-) -> DbtProfiles:
+) -> None:
     """Handle a single Databricks edit action."""
-    field_prompts = {
-        "host": ("Enter new host:", output.host, False),
-        "http_path": ("Enter new HTTP path:", output.http_path, False),
-        "schema": ("Enter new schema:", output.schema_, False),
-        "catalog": ("Enter new catalog (empty to clear):", output.catalog or "", True),
-    }
-
-    if action in field_prompts:
-        prompt, default, allow_empty = field_prompts[action]
-        field_name = "schema_" if action == "schema" else action
-        new_value = questionary.text(prompt, default=default).ask()
+    text_field = _DATABRICKS_TEXT_FIELDS.get(action)
+    if text_field:
+        prompt, field_name, allow_empty = text_field
+        new_value = questionary.text(prompt, default=getattr(output, field_name) or "").ask()
         if new_value is not None and (new_value or allow_empty):
-            profiles = _update_databricks_field(
-                profiles, profile_path, profile_name, output_name, field_name, new_value or None
-            )
+            _update_databricks_field(session, profile_name, output_name, field_name, new_value or None)
     elif action == "token":
         new_token = questionary.password("Enter new token (empty to clear):").ask()
         if new_token is not None:
-            profiles = _update_databricks_field(
-                profiles, profile_path, profile_name, output_name, "token", new_token or None
-            )
+            _update_databricks_field(session, profile_name, output_name, "token", new_token or None)
     elif action == "threads":
-        profiles = _update_output_threads(profiles, profile_path, profile_name, output_name, output.threads)
-
-    return profiles
+        _update_output_threads(session, profile_name, output_name, output.threads)
 
 
 def _edit_databricks_output_loop(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, output: DatabricksOutput
-) -> DbtProfiles:
+    session: ProfileSession, profile_name: str, output_name: str, output: DatabricksOutput
+) -> None:
     """Databricks output editing submenu loop."""
     while True:
         typer.echo(f"\n[Editing Databricks output: {profile_name}.{output_name}]")
@@ -970,28 +1003,25 @@ def _edit_databricks_output_loop(
         if action == "back":
             break
 
-        profiles = _handle_databricks_action(action, profiles, profile_path, profile_name, output_name, output)
+        _handle_databricks_action(action, session, profile_name, output_name, output)
 
         # Refresh output reference
         try:
-            output = get_output(profiles, profile_name, output_name)  # type: ignore[assignment]
+            output = get_output(session.profiles, profile_name, output_name)  # type: ignore[assignment]
         except (ProfileNotFoundError, OutputNotFoundError):
             break
 
-    return profiles
-
 
 def _update_databricks_field(
-    profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str, field: str, value: str | None
-) -> DbtProfiles:
+    session: ProfileSession, profile_name: str, output_name: str, field: str, value: str | None
+) -> None:
     """Update a Databricks output field."""
     try:
-        profiles = update_output_fields(profiles, profile_name, output_name, {field: value})
-        save_profiles(profiles, profile_path)
+        update_output_fields(session.profiles, profile_name, output_name, {field: value})
+        session.mark_dirty()
         typer.echo(f"Updated {field}")
     except (ProfileNotFoundError, OutputNotFoundError, ValueError) as e:
         typer.echo(str(e), err=True)
-    return profiles
 
 
 def _edit_output_loop(profiles: DbtProfiles, profile_path: Path, profile_name: str, output_name: str) -> DbtProfiles:
@@ -1012,10 +1042,13 @@ def _edit_output_loop(profiles: DbtProfiles, profile_path: Path, profile_name: s
         typer.echo(str(e), err=True)
         return profiles
 
-    if isinstance(output, DatabricksOutput):
-        return _edit_databricks_output_loop(profiles, profile_path, profile_name, output_name, output)
-    else:
-        return _edit_duckdb_output_loop(profiles, profile_path, profile_name, output_name, output)  # type: ignore[arg-type]
+    # Field edits are buffered and written once when the submenu exits
+    with ProfileSession(profiles, profile_path) as session:
+        if isinstance(output, DatabricksOutput):
+            _edit_databricks_output_loop(session, profile_name, output_name, output)
+        else:
+            _edit_duckdb_output_loop(session, profile_name, output_name, output)  # type: ignore[arg-type]
+    return session.profiles
 
 
 def _edit_profile_loop(profiles: DbtProfiles, profile_path: Path, profile_name: str) -> DbtProfiles:
@@ -1080,17 +1113,19 @@ def _handle_edit_output(profiles: DbtProfiles, profile_path: Path) -> DbtProfile
     return profiles
 
 
+_MAIN_HANDLERS: dict[MainAction, Callable[[DbtProfiles, Path], DbtProfiles]] = {
+    "add_profile": _handle_add_profile,
+    "edit_profile": _handle_edit_profile,
+    "delete_profile": _handle_delete_profile,
+    "add_output": _handle_add_output,
+    "edit_output": _handle_edit_output,
+    "delete_output": _handle_delete_output,
+}
+
+
 def _dispatch_action(action: MainAction, profiles: DbtProfiles, target_path: Path) -> DbtProfiles:
     """Dispatch main menu action to handler."""
-    handlers = {
-        "add_profile": _handle_add_profile,
-        "edit_profile": _handle_edit_profile,
-        "delete_profile": _handle_delete_profile,
-        "add_output": _handle_add_output,
-        "edit_output": _handle_edit_output,
-        "delete_output": _handle_delete_output,
-    }
-    handler = handlers.get(action)
+    handler = _MAIN_HANDLERS.get(action)
     if handler:
         return handler(profiles, target_path)
     return profiles
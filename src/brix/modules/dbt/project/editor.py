@@ -5,8 +5,9 @@ Provides CRUD operations for dbt_project.yml and packages.yml with atomic save-o
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from brix.modules.dbt.project.models import (
     DbtPackages,
@@ -16,6 +17,7 @@ from brix.modules.dbt.project.models import (
     LocalPackage,
     validate_project_name,
 )
+from brix.utils.files import write_text_if_changed
 from brix.utils.logging import get_logger
 
 # Fields that can be edited via CLI
@@ -43,6 +45,11 @@ PATH_FIELDS = frozenset(
 )
 
 
+# Parsed projects keyed on (resolved path, mtime_ns, size); stale entries are
+# never hit because any write changes the key, and save_project drops them.
+_load_cache: dict[tuple[Path, int, int], DbtProject] = {}
+
+
 class ProjectNotFoundError(Exception):
     """Raised when dbt_project.yml does not exist."""
 
@@ -62,6 +69,10 @@ class InvalidFieldError(Exception):
 def load_project(path: Path) -> DbtProject:
     """Load dbt_project.yml from disk.
 
+    Parsed projects are cached per path and modification time, so repeated
+    loads of an unchanged file skip the YAML parse. Callers get a copy and
+    may mutate it freely.
+
     Args:
         path: Path to dbt_project.yml file
 
@@ -74,12 +85,20 @@ def load_project(path: Path) -> DbtProject:
     """
     logger = get_logger()
 
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         msg = f"Project file not found: {path}"
-        raise ProjectNotFoundError(msg)
+        raise ProjectNotFoundError(msg) from None
 
-    logger.debug("Loading project from %s", path)
-    return DbtProject.from_file(path)
+    key = (path.resolve(), stat.st_mtime_ns, stat.st_size)
+    cached = _load_cache.get(key)
+    if cached is None:
+        logger.debug("Loading project from %s", path)
+        cached = _load_cache[key] = DbtProject.from_file(path)
+    else:
+        logger.debug("Using cached project for %s", path)
+    return cached.model_copy(deep=True)
 
 
 def save_project(project: DbtProject, path: Path) -> None:
@@ -95,18 +114,28 @@ def save_project(project: DbtProject, path: Path) -> None:
     """
     logger = get_logger()
 
-    # Validate by re-parsing (ensures YAML roundtrip is valid)
+    # Editors assign fields directly, so re-validate the dumped data in memory before writing
+    DbtProject.model_validate(project.model_dump(exclude_none=True, by_alias=True))
     yaml_content = project.to_yaml()
-    DbtProject.from_yaml(yaml_content)
 
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to disk
-    path.write_text(yaml_content)
+    # Write to disk (atomic, skipped when unchanged)
+    if not write_text_if_changed(path, yaml_content):
+        logger.debug("Project unchanged, not rewriting %s", path)
+        return
+    _invalidate_project_cache(path)
     logger.debug("Saved project to %s", path)
 
 
+def _invalidate_project_cache(path: Path) -> None:
+    """Drop cached parses for a project file."""
+    resolved = path.resolve()
+    for key in [key for key in _load_cache if key[0] == resolved]:
+        del _load_cache[key]
+
+
 def load_packages(project_dir: Path) -> DbtPackages:
     """Load packages.yml from project directory.
 
@@ -151,12 +180,14 @@ def save_packages(packages: DbtPackages, project_dir: Path) -> None:
 
     packages_path = project_dir / "packages.yml"
 
-    # Validate by re-parsing
+    # Re-validate in memory before writing
+    DbtPackages.model_validate(packages.model_dump(exclude_none=True))
     yaml_content = packages.to_yaml()
-    DbtPackages.from_yaml(yaml_content)
 
-    # Write to disk
-    packages_path.write_text(yaml_content)
+    # Write to disk (atomic, skipped when unchanged)
+    if not write_text_if_changed(packages_path, yaml_content):
+        logger.debug("Packages unchanged, not rewriting %s", packages_path)
+        return
     logger.debug("Saved packages to %s", packages_path)
 
 
@@ -235,7 +266,8 @@ def update_path_field(
             raise ValueError(msg)
         current_paths.remove(path_to_remove)
     elif action == "set":
-        current_paths = list(value) if isinstance(value, list) else [value]
+        # Drop duplicates in one pass, keeping first-seen order
+        current_paths = list(dict.fromkeys(value)) if isinstance(value, list) else [value]
     else:
         msg = f"Invalid action: {action}. Must be 'add', 'remove', or 'set'"
         raise ValueError(msg)
@@ -253,11 +285,7 @@ def _get_package_identifier(pkg: HubPackage | GitPackage | LocalPackage) -> str:
     Returns:
         Identifier string (package name, git URL, or local path)
     """
-    if isinstance(pkg, HubPackage):
-        return pkg.package
-    if isinstance(pkg, GitPackage):
-        return pkg.git
-    return pkg.local
+    return pkg.identifier
 
 
 def get_package_identifiers(packages: DbtPackages) -> list[str]:
@@ -282,10 +310,7 @@ def find_package_index(packages: DbtPackages, identifier: str) -> int | None:
     Returns:
         Index of package or None if not found
     """
-    for i, pkg in enumerate(packages.packages):
-        if _get_package_identifier(pkg) == identifier:
-            return i
-    return None
+    return packages.index_of(identifier)
 
 
 def has_package(packages: DbtPackages, identifier: str) -> bool:
@@ -323,7 +348,7 @@ def add_hub_package(
         msg = f"Package '{package_name}' already exists"
         raise PackageAlreadyExistsError(msg)
 
-    packages.packages.append(HubPackage(package=package_name, version=version))
+    packages.add_hub_package(package_name, version)
     return packages
 
 
@@ -351,7 +376,7 @@ def add_git_package(
         msg = f"Git package '{git_url}' already exists"
         raise PackageAlreadyExistsError(msg)
 
-    packages.packages.append(GitPackage(git=git_url, revision=revision, subdirectory=subdirectory))
+    packages.add_git_package(git_url, revision, subdirectory)
     return packages
 
 
@@ -375,7 +400,7 @@ def add_local_package(
         msg = f"Local package '{local_path}' already exists"
         raise PackageAlreadyExistsError(msg)
 
-    packages.packages.append(LocalPackage(local=local_path))
+    packages.add_local_package(local_path)
     return packages
 
 
@@ -437,6 +462,30 @@ def update_package_version(
     return packages
 
 
+def _hub_display(pkg: HubPackage) -> str:
+    """Format type info for a hub package."""
+    return f"hub: {pkg.version}"
+
+
+def _git_display(pkg: GitPackage) -> str:
+    """Format type info for a git package."""
+    info = f"git: {pkg.revision}"
+    return f"{info} ({pkg.subdirectory})" if pkg.subdirectory else info
+
+
+def _local_display(_pkg: LocalPackage) -> str:
+    """Format type info for a local package."""
+    return "local"
+
+
+# Exact package type -> type info formatter (one dict lookup instead of an isinstance chain)
+_PACKAGE_DISPLAY: dict[type, Callable[[Any], str]] = {
+    HubPackage: _hub_display,
+    GitPackage: _git_display,
+    LocalPackage: _local_display,
+}
+
+
 def get_package_display_info(packages: DbtPackages) -> list[tuple[str, str]]:
     """Get package information for display.
 
@@ -446,15 +495,4 @@ def get_package_display_info(packages: DbtPackages) -> list[tuple[str, str]]:
     Returns:
         List of (identifier, type_info) tuples for display
     """
-    result: list[tuple[str, str]] = []
-    for pkg in packages.packages:
-        if isinstance(pkg, HubPackage):
-            result.append((pkg.package, f"hub: {pkg.version}"))
-        elif isinstance(pkg, GitPackage):
-            info = f"git: {pkg.revision}"
-            if pkg.subdirectory:
-                info += f" ({pkg.subdirectory})"
-            result.append((pkg.git, info))
-        else:
-            result.append((pkg.local, "local"))
-    return result
+    return [(pkg.identifier, _PACKAGE_DISPLAY[type(pkg)](pkg)) for pkg in packages.packages]
@@ -6,11 +6,12 @@ with interactive fuzzy selection support.
 
 from __future__ import annotations
 
-import subprocess
+import functools
+import os
+from collections import Counter
 from pathlib import Path
 
-import questionary
-
+from brix.modules.dbt.project.editor import load_project
 from brix.modules.dbt.project.models import DbtProject
 from brix.utils.logging import get_logger
 
@@ -36,12 +37,30 @@ def get_search_root() -> Path:
     """Get the search root directory.
 
     Returns git repository root if in a git repo, otherwise current working directory.
+    The result is cached per working directory.
 
     Returns:
         Path to search root directory
     """
+    return _resolve_search_root(Path.cwd())
+
+
+@functools.cache
+def _resolve_search_root(cwd: Path) -> Path:
+    """Resolve the search root for a working directory.
+
+    Looks for a ``.git`` entry (directory, or file for worktrees) in cwd and its
+    parents before falling back to ``git rev-parse``.
+    """
     logger = get_logger()
 
+    for candidate in (cwd, *cwd.parents):
+        if (candidate / ".git").exists():
+            logger.debug("Using git root as search root: %s", candidate)
+            return candidate
+
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],  # noqa: S607
@@ -53,23 +72,10 @@ def get_search_root() -> Path:
         logger.debug("Using git root as search root: %s", git_root)
         return git_root
     except (subprocess.CalledProcessError, FileNotFoundError):
-        cwd = Path.cwd()
         logger.debug("Not in git repo, using cwd as search root: %s", cwd)
         return cwd
 
 
-def _should_exclude(path: Path) -> bool:
-    """Check if a path should be excluded from search.
-
-    Args:
-        path: Path to check
-
-    Returns:
-        True if path should be excluded
-    """
-    return any(part in EXCLUDE_DIRS for part in path.parts)
-
-
 def find_dbt_projects(
     root: Path | None = None,
     max_depth: int = 10,
@@ -92,24 +98,22 @@ def find_dbt_projects(
 
     projects: list[Path] = []
 
-    # Use glob to find all dbt_project.yml files
-    for project_file in search_root.glob("**/dbt_project.yml"):
-        # Check depth
+    # Walk with an explicit stack so excluded directories are pruned before descending
+    stack: list[tuple[str, int]] = [(str(search_root), 0)]
+    while stack:
+        directory, depth = stack.pop()
         try:
-            relative = project_file.relative_to(search_root)
-            depth = len(relative.parts) - 1  # Subtract 1 for the filename itself
-            if depth > max_depth:
-                continue
-        except ValueError:
-            continue
-
-        # Check exclusions
-        if _should_exclude(project_file):
-            logger.debug("Excluding project in excluded directory: %s", project_file)
-            continue
-
-        projects.append(project_file.resolve())
-        logger.debug("Found dbt project: %s", project_file)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < max_depth and entry.name not in EXCLUDE_DIRS:
+                            stack.append((entry.path, depth + 1))
+                    elif entry.name == "dbt_project.yml":
+                        project_file = Path(entry.path).resolve()
+                        projects.append(project_file)
+                        logger.debug("Found dbt project: %s", project_file)
+        except OSError as e:
+            logger.debug("Skipping unreadable directory %s: %s", directory, e)
 
     # Sort by path for consistent ordering
     projects.sort()
@@ -128,13 +132,16 @@ def _format_project_choice(project_path: Path, search_root: Path) -> str:
     Returns:
         Formatted string for display
     """
-    try:
-        # Get the project directory (parent of dbt_project.yml)
-        project_dir = project_path.parent
-        relative = project_dir.relative_to(search_root)
-        return str(relative) if str(relative) != "." else project_dir.name
-    except ValueError:
-        return str(project_path.parent)
+    # Plain string prefix check instead of Path.relative_to (called once per project in menus)
+    project_dir = project_path.parent
+    dir_str = str(project_dir)
+    root_str = str(search_root)
+    if dir_str == root_str:
+        return project_dir.name
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if dir_str.startswith(prefix):
+        return dir_str[len(prefix) :]
+    return dir_str
 
 
 def prompt_select_project(
@@ -153,16 +160,18 @@ def prompt_select_project(
     if not projects:
         return None
 
+    import questionary
+
     root = search_root or get_search_root()
 
     # Build choice mapping: display string -> actual path
-    choices: dict[str, Path] = {}
-    for project_path in projects:
-        display = _format_project_choice(project_path, root)
-        # Handle duplicate display names by appending parent info
-        if display in choices:
-            display = str(project_path.parent)
-        choices[display] = project_path
+    displays = [_format_project_choice(project_path, root) for project_path in projects]
+    # Ambiguous display names fall back to the full project directory
+    counts = Counter(displays)
+    choices: dict[str, Path] = {
+        display if counts[display] == 1 else str(project_path.parent): project_path
+        for display, project_path in zip(displays, projects, strict=True)
+    }
 
     # Use autocomplete for fuzzy search if many projects, otherwise select
     if len(choices) > 5:
@@ -220,7 +229,7 @@ def discover_and_select_project(
 
     # Load the project
     try:
-        project = DbtProject.from_file(project_path)
+        project = load_project(project_path)
         return (project_path, project)
     except Exception as e:
         typer.echo(f"Error loading project: {e}", err=True)
@@ -6,19 +6,33 @@ and packages.yml files.
 
 from __future__ import annotations
 
+import functools
 import re
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from types import MappingProxyType
+from typing import Annotated, Any, BinaryIO, Literal
 
-import yaml
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, field_validator
 
-# Project name validation regex - must start with letter/underscore, contain only alphanumeric/underscore
-PROJECT_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+from brix.utils.yaml_io import YAMLError, dump_yaml, load_yaml
 
 # Hub package name validation regex - must be namespace/name format
 HUB_PACKAGE_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+$")
 
+# Known package mappings for short names (read-only)
+KNOWN_PACKAGES: MappingProxyType[str, str] = MappingProxyType(
+    {
+        "dbt_utils": "dbt-labs/dbt_utils",
+        "dbt-utils": "dbt-labs/dbt_utils",
+        "elementary": "elementary-data/elementary",
+        "codegen": "dbt-labs/codegen",
+        "dbt_expectations": "calogica/dbt_expectations",
+        "dbt-expectations": "calogica/dbt_expectations",
+        "audit_helper": "dbt-labs/audit_helper",
+        "audit-helper": "dbt-labs/audit_helper",
+    }
+)
+
 
 class ProjectNameError(ValueError):
     """Raised when project name is invalid."""
@@ -40,7 +54,8 @@ def validate_project_name(name: str) -> str:
     Raises:
         ProjectNameError: If name doesn't match dbt requirements
     """
-    if not PROJECT_NAME_PATTERN.match(name):
+    # An ASCII identifier is exactly [a-zA-Z_][a-zA-Z0-9_]*, checked in C without the regex engine
+    if not (name.isascii() and name.isidentifier()):
         msg = (
             f"Invalid project name: '{name}'. "
             "Project name must start with a letter or underscore and contain only "
@@ -50,9 +65,12 @@ def validate_project_name(name: str) -> str:
     return name
 
 
+@functools.lru_cache(maxsize=256)
 def validate_hub_package_name(name: str) -> str:
     """Validate a dbt hub package name.
 
+    Successful validations are memoized; invalid names raise on every call.
+
     Args:
         name: Package name to validate (e.g., "dbt-labs/dbt_utils")
 
@@ -89,17 +107,17 @@ class DbtProject(BaseModel):
     version: str = "1.0.0"
     config_version: Literal[2] = Field(default=2, alias="config-version")
 
-    # Path configurations
-    model_paths: list[str] = Field(default=["models"], alias="model-paths")
-    seed_paths: list[str] = Field(default=["seeds"], alias="seed-paths")
-    test_paths: list[str] = Field(default=["tests"], alias="test-paths")
-    macro_paths: list[str] = Field(default=["macros"], alias="macro-paths")
-    snapshot_paths: list[str] = Field(default=["snapshots"], alias="snapshot-paths")
-    analysis_paths: list[str] = Field(default=["analyses"], alias="analysis-paths")
-    asset_paths: list[str] = Field(default=["assets"], alias="asset-paths")
+    # Path configurations (factories hand each instance its own list without deep-copying a shared default)
+    model_paths: list[str] = Field(default_factory=lambda: ["models"], alias="model-paths")
+    seed_paths: list[str] = Field(default_factory=lambda: ["seeds"], alias="seed-paths")
+    test_paths: list[str] = Field(default_factory=lambda: ["tests"], alias="test-paths")
+    macro_paths: list[str] = Field(default_factory=lambda: ["macros"], alias="macro-paths")
+    snapshot_paths: list[str] = Field(default_factory=lambda: ["snapshots"], alias="snapshot-paths")
+    analysis_paths: list[str] = Field(default_factory=lambda: ["analyses"], alias="analysis-paths")
+    asset_paths: list[str] = Field(default_factory=lambda: ["assets"], alias="asset-paths")
 
     # Build configuration
-    clean_targets: list[str] = Field(default=["target", "dbt_packages"], alias="clean-targets")
+    clean_targets: list[str] = Field(default_factory=lambda: ["target", "dbt_packages"], alias="clean-targets")
     require_dbt_version: str | None = Field(default=None, alias="require-dbt-version")
 
     # Model defaults (optional)
@@ -114,11 +132,11 @@ class DbtProject(BaseModel):
         return validate_project_name(v)
 
     @classmethod
-    def from_yaml(cls, content: str) -> DbtProject:
+    def from_yaml(cls, content: str | BinaryIO) -> DbtProject:
         """Parse project configuration from YAML string.
 
         Args:
-            content: YAML string content of dbt_project.yml
+            content: YAML string (or binary stream) content of dbt_project.yml
 
         Returns:
             Parsed DbtProject instance
@@ -127,8 +145,8 @@ class DbtProject(BaseModel):
             ValueError: If YAML is invalid or doesn't match schema
         """
         try:
-            data = yaml.safe_load(content)
-        except yaml.YAMLError as e:
+            data = load_yaml(content)
+        except YAMLError as e:
             msg = f"Invalid YAML: {e}"
             raise ValueError(msg) from e
 
@@ -152,8 +170,9 @@ class DbtProject(BaseModel):
             FileNotFoundError: If file doesn't exist
             ValueError: If YAML is invalid or doesn't match schema
         """
-        content = path.read_text()
-        return cls.from_yaml(content)
+        # Hand libyaml the binary stream so it decodes while parsing
+        with path.open("rb") as stream:
+            return cls.from_yaml(stream)
 
     def to_yaml(self) -> str:
         """Serialize project configuration to YAML string.
@@ -163,7 +182,7 @@ class DbtProject(BaseModel):
         """
         # Convert to dict, using aliases for YAML keys
         data = self.model_dump(exclude_none=True, by_alias=True)
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        return dump_yaml(data)
 
 
 # Package type models for packages.yml
@@ -188,6 +207,11 @@ class HubPackage(BaseModel):
         """Validate package name follows hub format."""
         return validate_hub_package_name(v)
 
+    @property
+    def identifier(self) -> str:
+        """Unique identifier within packages.yml (the hub package name)."""
+        return self.package
+
 
 class GitPackage(BaseModel):
     """A package from a Git repository.
@@ -204,6 +228,11 @@ class GitPackage(BaseModel):
     revision: str
     subdirectory: str | None = None
 
+    @property
+    def identifier(self) -> str:
+        """Unique identifier within packages.yml (the git URL)."""
+        return self.git
+
 
 class LocalPackage(BaseModel):
     """A package from the local filesystem.
@@ -216,9 +245,33 @@ class LocalPackage(BaseModel):
 
     local: str
 
+    @property
+    def identifier(self) -> str:
+        """Unique identifier within packages.yml (the local path)."""
+        return self.local
+
+
+def _package_kind(value: object) -> str | None:
+    """Pick the package model for a packages.yml entry from its source key."""
+    if isinstance(value, dict):
+        for key in ("package", "git", "local"):
+            if key in value:
+                return key
+        return None
+    return _PACKAGE_KINDS.get(type(value))
+
 
-# Union of all package types
-Package = Annotated[HubPackage | GitPackage | LocalPackage, Field(discriminator=None)]
+_PACKAGE_KINDS: dict[type, str] = {HubPackage: "package", GitPackage: "git", LocalPackage: "local"}
+
+# Union of all package types, dispatched on the source key so each entry is validated by one model
+Package = Annotated[
+    Annotated[HubPackage, Tag("package")] | Annotated[GitPackage, Tag("git")] | Annotated[LocalPackage, Tag("local")],
+    Discriminator(
+        _package_kind,
+        custom_error_type="invalid_package",
+        custom_error_message="Package entry must have a 'package', 'git', or 'local' key",
+    ),
+]
 
 
 class DbtPackages(BaseModel):
@@ -229,14 +282,14 @@ class DbtPackages(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    packages: list[HubPackage | GitPackage | LocalPackage] = Field(default_factory=list)
+    packages: list[Package] = Field(default_factory=list)
 
     @classmethod
-    def from_yaml(cls, content: str) -> DbtPackages:
+    def from_yaml(cls, content: str | BinaryIO) -> DbtPackages:
         """Parse packages configuration from YAML string.
 
         Args:
-            content: YAML string content of packages.yml
+            content: YAML string (or binary stream) content of packages.yml
 
         Returns:
             Parsed DbtPackages instance
@@ -245,8 +298,8 @@ class DbtPackages(BaseModel):
             ValueError: If YAML is invalid or doesn't match schema
         """
         try:
-            data = yaml.safe_load(content)
-        except yaml.YAMLError as e:
+            data = load_yaml(content)
+        except YAMLError as e:
             msg = f"Invalid YAML: {e}"
             raise ValueError(msg) from e
 
@@ -273,8 +326,9 @@ class DbtPackages(BaseModel):
             FileNotFoundError: If file doesn't exist
             ValueError: If YAML is invalid or doesn't match schema
         """
-        content = path.read_text()
-        return cls.from_yaml(content)
+        # Hand libyaml the binary stream so it decodes while parsing
+        with path.open("rb") as stream:
+            return cls.from_yaml(stream)
 
     def to_yaml(self) -> str:
         """Serialize packages configuration to YAML string.
@@ -283,7 +337,21 @@ class DbtPackages(BaseModel):
             YAML string representation
         """
         data = self.model_dump(exclude_none=True)
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        return dump_yaml(data)
+
+    def index_of(self, identifier: str) -> int | None:
+        """Find the position of a package by identifier.
+
+        Args:
+            identifier: Package name (hub), git URL, or local path
+
+        Returns:
+            Position of the first matching package, or None if not found
+        """
+        for position, pkg in enumerate(self.packages):
+            if pkg.identifier == identifier:
+                return position
+        return None
 
     def add_hub_package(self, package: str, version: str) -> None:
         """Add a hub package to the list.
@@ -8,14 +8,35 @@ Also provides interactive editing for existing projects.
 from __future__ import annotations
 
 import subprocess
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
 import questionary
 import typer
 
+from brix.modules.dbt.profile.editor import load_profiles
 from brix.modules.dbt.profile.models import DatabricksOutput, DbtProfiles
 from brix.modules.dbt.profile.service import get_default_profile_path
+from brix.modules.dbt.project.editor import (
+    PackageAlreadyExistsError,
+    PackageNotFoundError,
+    add_git_package,
+    add_hub_package,
+    add_local_package,
+    find_package_index,
+    get_package_display_info,
+    load_packages,
+    load_project,
+    remove_package,
+    save_packages,
+    save_project,
+    update_package_version,
+    update_path_field,
+    update_project_field,
+)
+from brix.modules.dbt.project.finder import discover_and_select_project
 from brix.modules.dbt.project.models import DbtPackages, DbtProject, HubPackage, ProjectNameError, validate_project_name
 from brix.modules.dbt.project.service import (
     POPULAR_PACKAGES,
@@ -30,6 +51,19 @@ from brix.modules.dbt.project.service import (
 # Materialization types
 MaterializationType = Literal["view", "table", "ephemeral"]
 
+# Package choices, built once and reused across prompts (dbt_utils is pre-selected and disabled)
+_PACKAGE_CHECKBOX_CHOICES = tuple(
+    questionary.Choice(f"{package} - {description}", value=package, checked=True, disabled="(always included)")
+    if package == "dbt-labs/dbt_utils"
+    else questionary.Choice(f"{package} - {description}", value=package, checked=False)
+    for package, description in POPULAR_PACKAGES
+)
+
+_HUB_PACKAGE_CHOICES = (
+    *(questionary.Choice(f"{package} - {description}", value=package) for package, description in POPULAR_PACKAGES),
+    questionary.Choice("Enter custom package name", value="_custom_"),
+)
+
 
 def prompt_project_name() -> str | None:
     """Prompt user for project name with validation.
@@ -104,13 +138,17 @@ def prompt_team() -> str | None:
     return team.strip()
 
 
-def prompt_profile_path() -> Path | None:
+def prompt_profile_path(default_path: Path | None = None) -> Path | None:
     """Prompt user for profiles.yml location.
 
+    Args:
+        default_path: Suggested location (resolved from the environment if None)
+
     Returns:
         Path to profiles.yml, or None for default
     """
-    default_path = get_default_profile_path()
+    if default_path is None:
+        default_path = get_default_profile_path()
 
     path_str = questionary.text(
         "profiles.yml location:",
@@ -134,12 +172,11 @@ def prompt_select_profile(profiles: DbtProfiles) -> str | None:
     Returns:
         Selected profile name, or None if cancelled
     """
-    profile_names = list(profiles.root.keys())
-    if not profile_names:
+    if not profiles.root:
         typer.echo("No profiles found.", err=True)
         return None
 
-    choices = [questionary.Choice(name, value=name) for name in profile_names]
+    choices = [questionary.Choice(name, value=name) for name in profiles.root]
     return questionary.select("Select profile:", choices=choices).ask()
 
 
@@ -221,31 +258,9 @@ def prompt_select_packages() -> list[str]:
     typer.echo("\n[Package Selection]")
     typer.echo("dbt_utils is always included. Select additional packages:\n")
 
-    # Build choices - dbt_utils is always selected
-    choices = []
-    for package, description in POPULAR_PACKAGES:
-        if package == "dbt-labs/dbt_utils":
-            # dbt_utils is pre-selected and disabled
-            choices.append(
-                questionary.Choice(
-                    f"{package} - {description}",
-                    value=package,
-                    checked=True,
-                    disabled="(always included)",
-                )
-            )
-        else:
-            choices.append(
-                questionary.Choice(
-                    f"{package} - {description}",
-                    value=package,
-                    checked=False,
-                )
-            )
-
     selected = questionary.checkbox(
         "Select packages:",
-        choices=choices,
+        choices=_PACKAGE_CHECKBOX_CHOICES,
     ).ask()
 
     if selected is None:
@@ -365,18 +380,15 @@ def run_dbt_deps(project_path: Path) -> bool:
     typer.echo("\nRunning 'dbt deps'...")
     try:
         # S607: Using partial path intentionally to use user's dbt installation
+        # Output is not captured so dbt's progress streams to the terminal as it runs
         result = subprocess.run(
             ["dbt", "deps"],  # noqa: S607
             cwd=project_path,
-            capture_output=True,
-            text=True,
             check=False,
         )
         if result.returncode == 0:
-            typer.echo(result.stdout)
             typer.echo("Packages installed successfully!")
             return True
-        typer.echo(result.stderr, err=True)
         typer.echo("Failed to install packages. Run 'dbt deps' manually.", err=True)
         return False
     except FileNotFoundError:
@@ -396,17 +408,17 @@ def _handle_existing_profiles(profiles: DbtProfiles) -> str | None:
     return None
 
 
-def _handle_no_profiles(project_name: str) -> tuple[DbtProfiles | None, str | None]:
+def _handle_no_profiles(project_name: str, default_path: Path) -> tuple[DbtProfiles | None, str | None]:
     """Handle profile setup when no profiles.yml found."""
     action = prompt_profile_not_found_action()
     if action is None:
         return None, None
 
     if action == "enter_path":
-        custom_path = prompt_profile_path()
+        custom_path = prompt_profile_path(default_path)
         if custom_path and custom_path.exists():
             try:
-                profiles = DbtProfiles.from_file(custom_path)
+                profiles = load_profiles(custom_path)
                 if profiles and profiles.root:
                     selected = prompt_select_profile(profiles)
                     return profiles, selected
@@ -427,14 +439,8 @@ def _handle_no_profiles(project_name: str) -> tuple[DbtProfiles | None, str | No
     return None, project_name
 
 
-def _get_databricks_options(
-    profiles: DbtProfiles | None, profile_name: str | None
-) -> tuple[MaterializationType | None, bool]:
+def _get_databricks_options(adapter_type: str | None) -> tuple[MaterializationType | None, bool]:
     """Get Databricks-specific options if applicable."""
-    if not profiles or not profile_name:
-        return None, False
-
-    adapter_type = _detect_profile_type(profiles, profile_name)
     if adapter_type != "databricks":
         return None, False
 
@@ -478,9 +484,7 @@ def _create_project(
             force=True,
         )
         typer.echo(f"\n{result.message}")
-        typer.echo("\nFiles created:")
-        for f in result.files_created:
-            typer.echo(f"  {f}")
+        typer.echo("\n".join(["\nFiles created:", *(f"  {f}" for f in result.files_created)]))
 
         if prompt_run_deps(result.project_path):
             run_dbt_deps(result.project_path)
@@ -523,7 +527,7 @@ def run_interactive_init(profile_path: Path | None = None) -> None:  # noqa: C90
     if effective_profile_path.exists():
         typer.echo(f"\nFound profiles.yml at {effective_profile_path}")
         try:
-            profiles = DbtProfiles.from_file(effective_profile_path)
+            profiles = load_profiles(effective_profile_path)
         except Exception as e:
             typer.echo(f"Warning: Could not parse profiles.yml: {e}", err=True)
 
@@ -533,16 +537,16 @@ def run_interactive_init(profile_path: Path | None = None) -> None:  # noqa: C90
             typer.echo("Cancelled.")
             return
     else:
-        profiles, selected_profile = _handle_no_profiles(project_name)
+        profiles, selected_profile = _handle_no_profiles(project_name, effective_profile_path)
         if selected_profile is None and profiles is None:
             return
 
-    materialization, persist_docs = _get_databricks_options(profiles, selected_profile)
-    if materialization is None and profiles and selected_profile:
-        adapter_type = _detect_profile_type(profiles, selected_profile)
-        if adapter_type == "databricks":
-            typer.echo("Cancelled.")
-            return
+    # Detect the adapter once from the already-parsed profiles
+    adapter_type = _detect_profile_type(profiles, selected_profile) if profiles and selected_profile else None
+    materialization, persist_docs = _get_databricks_options(adapter_type)
+    if materialization is None and adapter_type == "databricks":
+        typer.echo("Cancelled.")
+        return
 
     selected_packages = prompt_select_packages()
     with_example = prompt_with_example()
@@ -612,6 +616,50 @@ PathAction = Literal[
 # Action types for path editing
 PathEditAction = Literal["add", "remove", "view", "back"]
 
+# Menu choices, built once and reused across prompts
+_EDIT_MAIN_CHOICES = (
+    questionary.Choice("Edit project settings", value="edit_settings"),
+    questionary.Choice("Manage packages", value="manage_packages"),
+    questionary.Choice("Edit path configurations", value="edit_paths"),
+    questionary.Choice("Exit", value="exit"),
+)
+
+_SETTINGS_CHOICES = (
+    questionary.Choice("Edit project name", value="name"),
+    questionary.Choice("Edit profile name", value="profile"),
+    questionary.Choice("Edit version", value="version"),
+    questionary.Choice("Edit require-dbt-version", value="require_dbt_version"),
+    questionary.Choice("Back to main menu", value="back"),
+)
+
+_PACKAGE_ACTION_CHOICES = (
+    questionary.Choice("Add hub package", value="add_hub"),
+    questionary.Choice("Add git package", value="add_git"),
+    questionary.Choice("Add local package", value="add_local"),
+    questionary.Choice("Remove package", value="remove"),
+    questionary.Choice("Update package version", value="update_version"),
+    questionary.Choice("Back to main menu", value="back"),
+)
+
+_PATH_FIELD_CHOICES = (
+    questionary.Choice("model-paths", value="model_paths"),
+    questionary.Choice("seed-paths", value="seed_paths"),
+    questionary.Choice("test-paths", value="test_paths"),
+    questionary.Choice("macro-paths", value="macro_paths"),
+    questionary.Choice("snapshot-paths", value="snapshot_paths"),
+    questionary.Choice("analysis-paths", value="analysis_paths"),
+    questionary.Choice("asset-paths", value="asset_paths"),
+    questionary.Choice("clean-targets", value="clean_targets"),
+    questionary.Choice("Back to main menu", value="back"),
+)
+
+_PATH_EDIT_CHOICES = (
+    questionary.Choice("Add path", value="add"),
+    questionary.Choice("Remove path", value="remove"),
+    questionary.Choice("View current paths", value="view"),
+    questionary.Choice("Back", value="back"),
+)
+
 
 def prompt_edit_main_action() -> EditMainAction:
     """Prompt user for main edit menu action.
@@ -619,13 +667,7 @@ def prompt_edit_main_action() -> EditMainAction:
     Returns:
         Selected action
     """
-    choices = [
-        questionary.Choice("Edit project settings", value="edit_settings"),
-        questionary.Choice("Manage packages", value="manage_packages"),
-        questionary.Choice("Edit path configurations", value="edit_paths"),
-        questionary.Choice("Exit", value="exit"),
-    ]
-    result = questionary.select("What would you like to do?", choices=choices).ask()
+    result = questionary.select("What would you like to do?", choices=_EDIT_MAIN_CHOICES).ask()
     if result is None:
         return "exit"
     return result
@@ -637,14 +679,7 @@ def prompt_settings_action() -> SettingsAction:
     Returns:
         Selected action
     """
-    choices = [
-        questionary.Choice("Edit project name", value="name"),
-        questionary.Choice("Edit profile name", value="profile"),
-        questionary.Choice("Edit version", value="version"),
-        questionary.Choice("Edit require-dbt-version", value="require_dbt_version"),
-        questionary.Choice("Back to main menu", value="back"),
-    ]
-    result = questionary.select("What would you like to edit?", choices=choices).ask()
+    result = questionary.select("What would you like to edit?", choices=_SETTINGS_CHOICES).ask()
     if result is None:
         return "back"
     return result
@@ -656,15 +691,7 @@ def prompt_package_action() -> PackageAction:
     Returns:
         Selected action
     """
-    choices = [
-        questionary.Choice("Add hub package", value="add_hub"),
-        questionary.Choice("Add git package", value="add_git"),
-        questionary.Choice("Add local package", value="add_local"),
-        questionary.Choice("Remove package", value="remove"),
-        questionary.Choice("Update package version", value="update_version"),
-        questionary.Choice("Back to main menu", value="back"),
-    ]
-    result = questionary.select("What would you like to do?", choices=choices).ask()
+    result = questionary.select("What would you like to do?", choices=_PACKAGE_ACTION_CHOICES).ask()
     if result is None:
         return "back"
     return result
@@ -676,18 +703,7 @@ def prompt_path_field_action() -> PathAction:
     Returns:
         Selected path field or back
     """
-    choices = [
-        questionary.Choice("model-paths", value="model_paths"),
-        questionary.Choice("seed-paths", value="seed_paths"),
-        questionary.Choice("test-paths", value="test_paths"),
-        questionary.Choice("macro-paths", value="macro_paths"),
-        questionary.Choice("snapshot-paths", value="snapshot_paths"),
-        questionary.Choice("analysis-paths", value="analysis_paths"),
-        questionary.Choice("asset-paths", value="asset_paths"),
-        questionary.Choice("clean-targets", value="clean_targets"),
-        questionary.Choice("Back to main menu", value="back"),
-    ]
-    result = questionary.select("Select path field to edit:", choices=choices).ask()
+    result = questionary.select("Select path field to edit:", choices=_PATH_FIELD_CHOICES).ask()
     if result is None:
         return "back"
     return result
@@ -705,13 +721,7 @@ def prompt_path_edit_action(field_name: str, current_paths: list[str]) -> PathEd
     """
     typer.echo(f"\nCurrent {field_name}: {', '.join(current_paths) if current_paths else '(none)'}")
 
-    choices = [
-        questionary.Choice("Add path", value="add"),
-        questionary.Choice("Remove path", value="remove"),
-        questionary.Choice("View current paths", value="view"),
-        questionary.Choice("Back", value="back"),
-    ]
-    result = questionary.select("What would you like to do?", choices=choices).ask()
+    result = questionary.select("What would you like to do?", choices=_PATH_EDIT_CHOICES).ask()
     if result is None:
         return "back"
     return result
@@ -772,6 +782,14 @@ def prompt_edit_version(current: str) -> str | None:
     return questionary.text("Enter new version:", default=current).ask()
 
 
+# Plain string project fields -> prompt taking the current value
+_FIELD_PROMPTS: dict[str, Callable[[str], str | None]] = {
+    "name": prompt_edit_project_name,
+    "profile": prompt_edit_profile_name,
+    "version": prompt_edit_version,
+}
+
+
 def prompt_edit_require_dbt_version(current: str | None) -> str | None:
     """Prompt for new require-dbt-version.
 
@@ -799,10 +817,7 @@ def prompt_add_hub_package_details() -> tuple[str, str] | None:
         Tuple of (package_name, version) or None if cancelled
     """
     # Offer popular packages or custom entry
-    choices = [questionary.Choice(f"{pkg} - {desc}", value=pkg) for pkg, desc in POPULAR_PACKAGES]
-    choices.append(questionary.Choice("Enter custom package name", value="_custom_"))
-
-    selected = questionary.select("Select package:", choices=choices).ask()
+    selected = questionary.select("Select package:", choices=_HUB_PACKAGE_CHOICES).ask()
     if selected is None:
         return None
 
@@ -877,22 +892,29 @@ def prompt_add_local_package_path() -> str | None:
     ).ask()
 
 
-def prompt_select_package(packages: DbtPackages) -> str | None:
+def prompt_select_package(packages: DbtPackages, display_info: list[tuple[str, str]] | None = None) -> str | None:
     """Prompt user to select a package.
 
     Args:
         packages: DbtPackages instance
+        display_info: Precomputed get_package_display_info() result for packages, if available
 
     Returns:
         Selected package identifier or None if cancelled
     """
-    from brix.modules.dbt.project.editor import get_package_display_info
-
     if not packages.packages:
         typer.echo("No packages configured.", err=True)
         return None
 
-    display_info = get_package_display_info(packages)
+    if display_info is None:
+        display_info = get_package_display_info(packages)
+
+    # Nothing to choose between; callers still confirm destructive actions
+    if len(display_info) == 1:
+        ident, info = display_info[0]
+        typer.echo(f"Selected package: {ident} ({info})")
+        return ident
+
     choices = [questionary.Choice(f"{ident} ({info})", value=ident) for ident, info in display_info]
 
     return questionary.select("Select package:", choices=choices).ask()
@@ -977,217 +999,245 @@ def _display_project_status(project: DbtProject, packages: DbtPackages, project_
         packages: DbtPackages instance
         project_path: Path to dbt_project.yml
     """
-    typer.echo(f"\n[Editing: {project_path.parent}]")
-    typer.echo(f"  name: {project.name}")
-    typer.echo(f"  profile: {project.profile}")
-    typer.echo(f"  version: {project.version}")
+    lines = [
+        f"\n[Editing: {project_path.parent}]",
+        f"  name: {project.name}",
+        f"  profile: {project.profile}",
+        f"  version: {project.version}",
+    ]
     if project.require_dbt_version:
-        typer.echo(f"  require-dbt-version: {project.require_dbt_version}")
-    typer.echo(f"  packages: {len(packages.packages)}")
+        lines.append(f"  require-dbt-version: {project.require_dbt_version}")
+    lines.append(f"  packages: {len(packages.packages)}")
+    # One write per redraw instead of one per line
+    typer.echo("\n".join(lines))
 
 
-def _handle_settings_action(
-    action: SettingsAction,
-    project: DbtProject,
-    project_path: Path,
-) -> DbtProject:
+@dataclass
+class ProjectSession:
+    """Buffers project and package edits made in a submenu and saves them once.
+
+    Used as a context manager: pending edits are flushed on exit, including
+    when the submenu is left via Ctrl+C. A failed save is reported and the
+    edits stay pending, so the next exit retries.
+    """
+
+    project: DbtProject
+    packages: DbtPackages
+    project_path: Path
+    project_dirty: bool = False
+    packages_dirty: bool = False
+    _package_display: list[tuple[str, str]] | None = field(default=None, init=False, repr=False)
+
+    def mark_project_dirty(self) -> None:
+        """Record that dbt_project.yml changed and needs saving."""
+        self.project_dirty = True
+
+    def mark_packages_dirty(self) -> None:
+        """Record that packages.yml changed and needs saving."""
+        self.packages_dirty = True
+        self._package_display = None
+
+    def package_display_info(self) -> list[tuple[str, str]]:
+        """Get display info for the current packages, reused until they change."""
+        if self._package_display is None:
+            self._package_display = get_package_display_info(self.packages)
+        return self._package_display
+
+    def flush(self) -> None:
+        """Save dbt_project.yml and packages.yml to disk if they have pending edits."""
+        if self.project_dirty:
+            save_project(self.project, self.project_path)
+            self.project_dirty = False
+        if self.packages_dirty:
+            save_packages(self.packages, self.project_path)
+            self.packages_dirty = False
+
+    def __enter__(self) -> ProjectSession:
+        """Enter the session."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flush pending edits on exit, reporting save errors instead of raising."""
+        try:
+            self.flush()
+        except (OSError, ValueError) as e:
+            typer.echo(f"Error saving changes: {e}", err=True)
+
+
+def _handle_settings_action(action: SettingsAction, session: ProjectSession) -> None:
     """Handle settings menu action.
 
     Args:
         action: Selected action
-        project: Current project
-        project_path: Path to dbt_project.yml
-
-    Returns:
-        Updated project
+        session: Editing session holding the current project
     """
-    from brix.modules.dbt.project.editor import save_project, update_project_field
-
     if action == "back":
-        return project
+        return
+
+    project = session.project
 
     # Handle require_dbt_version separately since it can be None
     if action == "require_dbt_version":
         new_value = prompt_edit_require_dbt_version(project.require_dbt_version)
         if new_value != project.require_dbt_version:
             try:
-                project = update_project_field(project, action, new_value)
-                save_project(project, project_path)
+                session.project = update_project_field(project, action, new_value)
+                session.mark_project_dirty()
                 typer.echo("Updated require-dbt-version")
             except Exception as e:
                 typer.echo(f"Error: {e}", err=True)
-        return project
+        return
 
     # Handle other string fields
-    field_values: dict[str, str] = {
-        "name": project.name,
-        "profile": project.profile,
-        "version": project.version,
-    }
-    field_prompts = {
-        "name": prompt_edit_project_name,
-        "profile": prompt_edit_profile_name,
-        "version": prompt_edit_version,
-    }
-
-    if action not in field_values:
-        return project
-
-    current_value = field_values[action]
-    new_value = field_prompts[action](current_value)
+    field_prompt = _FIELD_PROMPTS.get(action)
+    if field_prompt is None:
+        return
+
+    current_value = getattr(project, action)
+    new_value = field_prompt(current_value)
 
     if new_value is not None and new_value != current_value:
         try:
-            project = update_project_field(project, action, new_value)
-            save_project(project, project_path)
+            session.project = update_project_field(project, action, new_value)
+            session.mark_project_dirty()
             typer.echo(f"Updated {action.replace('_', '-')}")
         except Exception as e:
             typer.echo(f"Error: {e}", err=True)
 
-    return project
 
+def _handle_add_hub(session: ProjectSession) -> None:
+    """Prompt for and add a hub package."""
+    details = prompt_add_hub_package_details()
+    if details:
+        package_name, version = details
+        try:
+            session.packages = add_hub_package(session.packages, package_name, version)
+            session.mark_packages_dirty()
+            typer.echo(f"Added package: {package_name} ({version})")
+        except PackageAlreadyExistsError as e:
+            typer.echo(str(e), err=True)
 
-def _handle_package_action(  # noqa: C901
-    action: PackageAction,
-    packages: DbtPackages,
-    project_path: Path,
-) -> DbtPackages:
+
+def _handle_add_git(session: ProjectSession) -> None:
+    """Prompt for and add a git package."""
+    details = prompt_add_git_package_details()
+    if details:
+        git_url, revision, subdirectory = details
+        try:
+            session.packages = add_git_package(session.packages, git_url, revision, subdirectory)
+            session.mark_packages_dirty()
+            typer.echo(f"Added git package: {git_url}")
+        except PackageAlreadyExistsError as e:
+            typer.echo(str(e), err=True)
+
+
+def _handle_add_local(session: ProjectSession) -> None:
+    """Prompt for and add a local package."""
+    local_path = prompt_add_local_package_path()
+    if local_path:
+        try:
+            session.packages = add_local_package(session.packages, local_path)
+            session.mark_packages_dirty()
+            typer.echo(f"Added local package: {local_path}")
+        except PackageAlreadyExistsError as e:
+            typer.echo(str(e), err=True)
+
+
+def _handle_remove_package(session: ProjectSession) -> None:
+    """Prompt for and remove a package."""
+    identifier = prompt_select_package(session.packages, session.package_display_info())
+    if identifier and prompt_confirm_delete(f"package '{identifier}'"):
+        try:
+            session.packages = remove_package(session.packages, identifier)
+            session.mark_packages_dirty()
+            typer.echo(f"Removed package: {identifier}")
+        except PackageNotFoundError as e:
+            typer.echo(str(e), err=True)
+
+
+def _handle_update_version(session: ProjectSession) -> None:
+    """Prompt for and update a hub package's version."""
+    identifier = prompt_select_package(session.packages, session.package_display_info())
+    if not identifier:
+        return
+
+    # Find current version
+    idx = find_package_index(session.packages, identifier)
+    if idx is None:
+        return
+    pkg = session.packages.packages[idx]
+    if not isinstance(pkg, HubPackage):
+        typer.echo("Can only update version for hub packages.", err=True)
+        return
+
+    new_version = prompt_new_package_version(pkg.version)
+    if new_version and new_version != pkg.version:
+        try:
+            session.packages = update_package_version(session.packages, identifier, new_version)
+            session.mark_packages_dirty()
+            typer.echo(f"Updated {identifier} to {new_version}")
+        except (PackageNotFoundError, ValueError) as e:
+            typer.echo(str(e), err=True)
+
+
+_PACKAGE_HANDLERS: dict[PackageAction, Callable[[ProjectSession], None]] = {
+    "add_hub": _handle_add_hub,
+    "add_git": _handle_add_git,
+    "add_local": _handle_add_local,
+    "remove": _handle_remove_package,
+    "update_version": _handle_update_version,
+}
+
+
+def _handle_package_action(action: PackageAction, session: ProjectSession) -> None:
     """Handle package menu action.
 
     Args:
         action: Selected action
-        packages: Current packages
-        project_path: Path to dbt_project.yml (for directory)
-
-    Returns:
-        Updated packages
+        session: Editing session holding the current packages
     """
-    from brix.modules.dbt.project.editor import (
-        PackageAlreadyExistsError,
-        PackageNotFoundError,
-        add_git_package,
-        add_hub_package,
-        add_local_package,
-        remove_package,
-        save_packages,
-        update_package_version,
-    )
+    handler = _PACKAGE_HANDLERS.get(action)
+    if handler:
+        handler(session)
 
-    if action == "add_hub":
-        details = prompt_add_hub_package_details()
-        if details:
-            package_name, version = details
-            try:
-                packages = add_hub_package(packages, package_name, version)
-                save_packages(packages, project_path)
-                typer.echo(f"Added package: {package_name} ({version})")
-            except PackageAlreadyExistsError as e:
-                typer.echo(str(e), err=True)
-
-    elif action == "add_git":
-        details = prompt_add_git_package_details()
-        if details:
-            git_url, revision, subdirectory = details
-            try:
-                packages = add_git_package(packages, git_url, revision, subdirectory)
-                save_packages(packages, project_path)
-                typer.echo(f"Added git package: {git_url}")
-            except PackageAlreadyExistsError as e:
-                typer.echo(str(e), err=True)
-
-    elif action == "add_local":
-        local_path = prompt_add_local_package_path()
-        if local_path:
-            try:
-                packages = add_local_package(packages, local_path)
-                save_packages(packages, project_path)
-                typer.echo(f"Added local package: {local_path}")
-            except PackageAlreadyExistsError as e:
-                typer.echo(str(e), err=True)
-
-    elif action == "remove":
-        identifier = prompt_select_package(packages)
-        if identifier and prompt_confirm_delete(f"package '{identifier}'"):
-            try:
-                packages = remove_package(packages, identifier)
-                save_packages(packages, project_path)
-                typer.echo(f"Removed package: {identifier}")
-            except PackageNotFoundError as e:
-                typer.echo(str(e), err=True)
-
-    elif action == "update_version":
-        identifier = prompt_select_package(packages)
-        if identifier:
-            # Find current version
-            from brix.modules.dbt.project.editor import find_package_index
-            from brix.modules.dbt.project.models import HubPackage as HubPkg
-
-            idx = find_package_index(packages, identifier)
-            if idx is not None:
-                pkg = packages.packages[idx]
-                if isinstance(pkg, HubPkg):
-                    new_version = prompt_new_package_version(pkg.version)
-                    if new_version and new_version != pkg.version:
-                        try:
-                            packages = update_package_version(packages, identifier, new_version)
-                            save_packages(packages, project_path)
-                            typer.echo(f"Updated {identifier} to {new_version}")
-                        except (PackageNotFoundError, ValueError) as e:
-                            typer.echo(str(e), err=True)
-                else:
-                    typer.echo("Can only update version for hub packages.", err=True)
-
-    return packages
-
-
-def _handle_path_action(  # noqa: C901
-    field: PathAction,
-    project: DbtProject,
-    project_path: Path,
-) -> DbtProject:
+
+def _handle_path_action(field: PathAction, session: ProjectSession) -> None:  # noqa: C901
     """Handle path field editing.
 
     Args:
         field: Path field to edit
-        project: Current project
-        project_path: Path to dbt_project.yml
-
-    Returns:
-        Updated project
+        session: Editing session holding the current project
     """
-    from brix.modules.dbt.project.editor import save_project, update_path_field
-
     if field == "back":
-        return project
+        return
 
-    current_paths: list[str] = getattr(project, field, [])
+    label = field.replace("_", "-")
+    # update_path_field edits this list in place for add/remove, so it stays current without re-reading
+    current_paths: list[str] = getattr(session.project, field, [])
 
     while True:
-        action = prompt_path_edit_action(field.replace("_", "-"), current_paths)
+        action = prompt_path_edit_action(label, current_paths)
 
         if action == "back":
             break
 
         if action == "view":
             if current_paths:
-                typer.echo(f"\n{field.replace('_', '-')}:")
-                for p in current_paths:
-                    typer.echo(f"  - {p}")
+                typer.echo("\n".join([f"\n{label}:", *(f"  - {p}" for p in current_paths)]))
             else:
-                typer.echo(f"\n{field.replace('_', '-')}: (none)")
+                typer.echo(f"\n{label}: (none)")
             continue
 
         if action == "add":
-            new_path = prompt_add_path(field.replace("_", "-"))
+            new_path = prompt_add_path(label)
             if new_path:
                 try:
-                    project = update_path_field(project, field, "add", new_path)
-                    save_project(project, project_path)
-                    current_paths = getattr(project, field, [])
-                    typer.echo(f"Added '{new_path}' to {field.replace('_', '-')}")
+                    session.project = update_path_field(session.project, field, "add", new_path)
+                    session.mark_project_dirty()
+                    typer.echo(f"Added '{new_path}' to {label}")
 
                     # Offer to create directory
-                    full_path = project_path.parent / new_path
+                    full_path = session.project_path.parent / new_path
                     if not full_path.exists() and prompt_create_directory(full_path):
                         full_path.mkdir(parents=True, exist_ok=True)
                         typer.echo(f"Created directory: {full_path}")
@@ -1198,99 +1248,96 @@ def _handle_path_action(  # noqa: C901
             path_to_remove = prompt_remove_path(current_paths)
             if path_to_remove:
                 try:
-                    project = update_path_field(project, field, "remove", path_to_remove)
-                    save_project(project, project_path)
-                    current_paths = getattr(project, field, [])
-                    typer.echo(f"Removed '{path_to_remove}' from {field.replace('_', '-')}")
+                    session.project = update_path_field(session.project, field, "remove", path_to_remove)
+                    session.mark_project_dirty()
+                    typer.echo(f"Removed '{path_to_remove}' from {label}")
                 except Exception as e:
                     typer.echo(f"Error: {e}", err=True)
 
-    return project
-
 
-def _edit_settings_loop(project: DbtProject, project_path: Path) -> DbtProject:
+def _edit_settings_loop(session: ProjectSession) -> None:
     """Settings editing submenu loop.
 
     Args:
-        project: Current project
-        project_path: Path to dbt_project.yml
-
-    Returns:
-        Updated project
+        session: Editing session holding the current project
     """
     while True:
-        typer.echo(f"\n[Project Settings: {project.name}]")
-        typer.echo(f"  name: {project.name}")
-        typer.echo(f"  profile: {project.profile}")
-        typer.echo(f"  version: {project.version}")
-        typer.echo(f"  require-dbt-version: {project.require_dbt_version or '(not set)'}")
+        project = session.project
+        typer.echo(
+            "\n".join(
+                [
+                    f"\n[Project Settings: {project.name}]",
+                    f"  name: {project.name}",
+                    f"  profile: {project.profile}",
+                    f"  version: {project.version}",
+                    f"  require-dbt-version: {project.require_dbt_version or '(not set)'}",
+                ]
+            )
+        )
 
         action = prompt_settings_action()
         if action == "back":
             break
 
-        project = _handle_settings_action(action, project, project_path)
+        _handle_settings_action(action, session)
 
-    return project
 
-
-def _edit_packages_loop(packages: DbtPackages, project_path: Path) -> DbtPackages:
+def _edit_packages_loop(session: ProjectSession) -> None:
     """Packages editing submenu loop.
 
     Args:
-        packages: Current packages
-        project_path: Path to dbt_project.yml
-
-    Returns:
-        Updated packages
+        session: Editing session holding the current packages
     """
-    from brix.modules.dbt.project.editor import get_package_display_info
-
     while True:
-        typer.echo("\n[Packages]")
-        if packages.packages:
-            for ident, info in get_package_display_info(packages):
-                typer.echo(f"  - {ident} ({info})")
+        display_info = session.package_display_info()
+        if display_info:
+            typer.echo("\n".join(["\n[Packages]", *(f"  - {ident} ({info})" for ident, info in display_info)]))
         else:
-            typer.echo("  (no packages)")
+            typer.echo("\n[Packages]\n  (no packages)")
 
         action = prompt_package_action()
         if action == "back":
             break
 
-        packages = _handle_package_action(action, packages, project_path)
-
-    return packages
+        _handle_package_action(action, session)
 
 
-def _edit_paths_loop(project: DbtProject, project_path: Path) -> DbtProject:
+def _edit_paths_loop(session: ProjectSession) -> None:
     """Path configurations editing submenu loop.
 
     Args:
-        project: Current project
-        project_path: Path to dbt_project.yml
-
-    Returns:
-        Updated project
+        session: Editing session holding the current project
     """
     while True:
-        typer.echo("\n[Path Configurations]")
-        typer.echo(f"  model-paths: {', '.join(project.model_paths)}")
-        typer.echo(f"  seed-paths: {', '.join(project.seed_paths)}")
-        typer.echo(f"  test-paths: {', '.join(project.test_paths)}")
-        typer.echo(f"  macro-paths: {', '.join(project.macro_paths)}")
-        typer.echo(f"  snapshot-paths: {', '.join(project.snapshot_paths)}")
-        typer.echo(f"  analysis-paths: {', '.join(project.analysis_paths)}")
-        typer.echo(f"  asset-paths: {', '.join(project.asset_paths)}")
-        typer.echo(f"  clean-targets: {', '.join(project.clean_targets)}")
+        project = session.project
+        typer.echo(
+            "\n".join(
+                [
+                    "\n[Path Configurations]",
+                    f"  model-paths: {', '.join(project.model_paths)}",
+                    f"  seed-paths: {', '.join(project.seed_paths)}",
+                    f"  test-paths: {', '.join(project.test_paths)}",
+                    f"  macro-paths: {', '.join(project.macro_paths)}",
+                    f"  snapshot-paths: {', '.join(project.snapshot_paths)}",
+                    f"  analysis-paths: {', '.join(project.analysis_paths)}",
+                    f"  asset-paths: {', '.join(project.asset_paths)}",
+                    f"  clean-targets: {', '.join(project.clean_targets)}",
+                ]
+            )
+        )
 
         field = prompt_path_field_action()
         if field == "back":
             break
 
-        project = _handle_path_action(field, project, project_path)
+        _handle_path_action(field, session)
+
 
-    return project
+_SUBMENU_LOOPS: dict[EditMainAction, Callable[[ProjectSession], None]] = {
+    "edit_settings": _edit_settings_loop,
+    "manage_packages": _edit_packages_loop,
+    "edit_paths": _edit_paths_loop,
+}
 
 
 def run_interactive_edit(project_path: Path | None = None) -> None:
@@ -1301,9 +1348,6 @@ def run_interactive_edit(project_path: Path | None = None) -> None:
     Args:
         project_path: Path to dbt_project.yml, discovers project if None
     """
-    from brix.modules.dbt.project.editor import load_packages, load_project
-    from brix.modules.dbt.project.finder import discover_and_select_project
-
     # Discover or use provided project
     if project_path is None:
         result = discover_and_select_project()
@@ -1318,25 +1362,24 @@ def run_interactive_edit(project_path: Path | None = None) -> None:
             return
 
     # Load packages
-    packages = load_packages(project_path)
+    session = ProjectSession(project, load_packages(project_path), project_path)
 
     typer.echo(f"Editing project at: {project_path.parent}")
 
     try:
         while True:
-            _display_project_status(project, packages, project_path)
+            _display_project_status(session.project, session.packages, project_path)
             action = prompt_edit_main_action()
 
             if action == "exit":
                 typer.echo("Goodbye!")
                 break
 
-            if action == "edit_settings":
-                project = _edit_settings_loop(project, project_path)
-            elif action == "manage_packages":
-                packages = _edit_packages_loop(packages, project_path)
-            elif action == "edit_paths":
-                project = _edit_paths_loop(project, project_path)
+            submenu = _SUBMENU_LOOPS.get(action)
+            if submenu:
+                # Edits are buffered and written once when the submenu exits
+                with session:
+                    submenu(session)
 
     except KeyboardInterrupt:
         typer.echo("\nExiting...")
@@ -0,0 +1,77 @@
+"""On-disk cache for dbt Hub registry responses.
+
+Stores the full package JSON returned by hub.getdbt.com so repeated
+project init/edit runs can skip the network round trip.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from brix.utils.files import write_text_atomic
+from brix.utils.logging import get_logger
+
+CACHE_DIR = Path.home() / ".cache" / "brix" / "hub"
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+def get_cache_file(package: str) -> Path:
+    """Get the cache file path for a hub package.
+
+    Args:
+        package: Package name (e.g., "dbt-labs/dbt_utils")
+
+    Returns:
+        Path to the cache file (e.g., ~/.cache/brix/hub/dbt-labs__dbt_utils.json)
+    """
+    namespace, _, name = package.partition("/")
+    return CACHE_DIR / f"{namespace}__{name}.json"
+
+
+def load_cached_package(package: str) -> dict[str, Any] | None:
+    """Load cached registry data for a package if still fresh.
+
+    Args:
+        package: Package name (e.g., "dbt-labs/dbt_utils")
+
+    Returns:
+        Cached package JSON, or None if missing, stale, or unreadable
+    """
+    logger = get_logger()
+    cache_file = get_cache_file(package)
+    try:
+        age = time.time() - cache_file.stat().st_mtime
+        if age > CACHE_TTL_SECONDS:
+            logger.debug("Registry cache stale for %s (%.0fs old)", package, age)
+            return None
+        data = json.loads(cache_file.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Failed to load registry cache for %s: %s", package, e)
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    logger.debug("Loaded registry cache for %s", package)
+    return data
+
+
+def save_cached_package(package: str, data: dict[str, Any]) -> None:
+    """Save registry data for a package to the cache (silent on failure).
+
+    Args:
+        package: Package name (e.g., "dbt-labs/dbt_utils")
+        data: Package JSON as returned by dbt Hub
+    """
+    logger = get_logger()
+    cache_file = get_cache_file(package)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(cache_file, json.dumps(data))
+        logger.debug("Registry cache updated at %s", cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Failed to write registry cache for %s: %s", package, e)
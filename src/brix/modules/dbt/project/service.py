@@ -5,10 +5,12 @@ Handles project initialization, path resolution, and package version fetching.
 
 from __future__ import annotations
 
+import functools
+import json
 import urllib.request
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,9 +20,13 @@ from brix.modules.dbt.project.models import (
     HubPackage,
     validate_project_name,
 )
+from brix.modules.dbt.project.registry_cache import load_cached_package, save_cached_package
 from brix.templates import get_template
 from brix.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # Default fallback versions if API fetch fails
 DEFAULT_PACKAGE_VERSIONS: dict[str, str] = {
     "dbt-labs/dbt_utils": ">=1.0.0",
@@ -103,9 +109,25 @@ def resolve_project_path(
     return effective_base / project_name
 
 
+def _version_from_data(data: dict) -> str | None:
+    """Extract a version specifier from dbt Hub package JSON.
+
+    Args:
+        data: Package JSON from dbt Hub (live or cached)
+
+    Returns:
+        Version string (e.g., ">=1.3.0") or None if no version present
+    """
+    version = data.get("version")
+    return f">={version}" if version else None
+
+
 def fetch_package_version(package: str) -> str | None:
     """Fetch the latest version of a package from dbt Hub.
 
+    Consults the on-disk registry cache first and only hits the network
+    on a miss; successful responses are written back to the cache.
+
     Args:
         package: Package name (e.g., "dbt-labs/dbt_utils")
 
@@ -114,6 +136,11 @@ def fetch_package_version(package: str) -> str | None:
     """
     logger = get_logger()
 
+    cached = load_cached_package(package)
+    if cached is not None and (version := _version_from_data(cached)):
+        logger.debug("Using cached version %s for %s", version, package)
+        return version
+
     try:
         namespace, name = package.split("/")
         url = f"https://hub.getdbt.com/api/v1/{namespace}/{name}/latest.json"
@@ -122,22 +149,24 @@ def fetch_package_version(package: str) -> str | None:
 
         # Simple HTTP GET with timeout
         with urllib.request.urlopen(url, timeout=5) as response:  # noqa: S310
-            import json
-
             data = json.loads(response.read().decode())
-            version = data.get("version")
+            version = _version_from_data(data)
             if version:
                 logger.debug("Found version %s for %s", version, package)
-                return f">={version}"
+                save_cached_package(package, data)
+                return version
     except Exception as e:
         logger.debug("Failed to fetch version for %s: %s", package, e)
 
     return None
 
 
+@functools.cache
 def get_package_version(package: str) -> str:
     """Get the version for a package, with fallback to defaults.
 
+    Results are memoized for the lifetime of the process.
+
     Args:
         package: Package name (e.g., "dbt-labs/dbt_utils")
 
@@ -153,34 +182,60 @@ def get_package_version(package: str) -> str:
     return DEFAULT_PACKAGE_VERSIONS.get(package, ">=0.1.0")
 
 
-def fetch_package_versions_parallel(pkg_names: list[str], max_workers: int = 5) -> dict[str, str]:
-    """Fetch multiple package versions in parallel.
+def iter_package_versions(pkg_names: list[str], max_workers: int = 5) -> Iterator[tuple[str, str]]:
+    """Yield package versions as they become available.
+
+    Packages already present in the registry cache are yielded first;
+    the remaining lookups are submitted to a thread pool up front and
+    yielded in completion order.
 
     Args:
         pkg_names: List of package names (e.g., ["dbt-labs/dbt_utils", "elementary-data/elementary"])
         max_workers: Maximum number of concurrent threads
 
-    Returns:
-        Dictionary mapping package names to version strings
+    Yields:
+        Tuples of (package name, version string)
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     logger = get_logger()
-    results: dict[str, str] = {}
+    pending: list[str] = []
+
+    for pkg in pkg_names:
+        cached = load_cached_package(pkg)
+        if cached is not None and (version := _version_from_data(cached)):
+            yield pkg, version
+        else:
+            pending.append(pkg)
+
+    if not pending:
+        logger.debug("All %d package versions served from cache", len(pkg_names))
+        return
 
-    logger.debug("Fetching %d package versions in parallel", len(pkg_names))
+    logger.debug("Fetching %d package versions in parallel", len(pending))
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(get_package_version, pkg): pkg for pkg in pkg_names}
+        futures = {executor.submit(get_package_version, pkg): pkg for pkg in pending}
         for future in as_completed(futures):
             pkg_name = futures[future]
             try:
-                results[pkg_name] = future.result()
+                yield pkg_name, future.result()
             except Exception as e:
                 logger.debug("Failed to fetch version for %s: %s", pkg_name, e)
-                results[pkg_name] = DEFAULT_PACKAGE_VERSIONS.get(pkg_name, ">=0.1.0")
+                yield pkg_name, DEFAULT_PACKAGE_VERSIONS.get(pkg_name, ">=0.1.0")
+
+
+def fetch_package_versions_parallel(pkg_names: list[str], max_workers: int = 5) -> dict[str, str]:
+    """Fetch multiple package versions in parallel.
 
-    return results
+    Args:
+        pkg_names: List of package names (e.g., ["dbt-labs/dbt_utils", "elementary-data/elementary"])
+        max_workers: Maximum number of concurrent threads
+
+    Returns:
+        Dictionary mapping package names to version strings
+    """
+    return dict(iter_package_versions(pkg_names, max_workers))
 
 
 def create_project_structure(
@@ -0,0 +1,79 @@
+"""File writing helpers."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Atomically replace a file's text.
+
+    The content goes to a uniquely named temp file in the same directory that is
+    flushed, fsynced and then renamed over the target, so readers never observe a
+    half-written file and concurrent writers never share a temp file. Symlinks are
+    followed, so the link target is updated rather than replaced. An existing file
+    keeps its permission bits; a new one gets the usual umask-derived mode.
+
+    Args:
+        path: Target file path (parent directory must exist)
+        content: Text to write (UTF-8)
+    """
+    path = path.resolve()
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    _replace(path, content.encode(), mode)
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    """Atomically write text to a file unless it already has exactly this content.
+
+    Writes the same way as :func:`write_text_atomic`.
+
+    Args:
+        path: Target file path (parent directory must exist)
+        content: Text to write (UTF-8)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = path.resolve()
+    data = content.encode()
+    try:
+        current = path.stat()
+    except FileNotFoundError:
+        current = None
+
+    # Size check first so most real changes skip reading the old file
+    if current is not None and current.st_size == len(data) and path.read_bytes() == data:
+        return False
+
+    _replace(path, data, current.st_mode & 0o7777 if current is not None else None)
+    return True
+
+
+def _replace(path: Path, data: bytes, mode: int | None) -> None:
+    """Write data to a unique sibling temp file and rename it over a resolved path.
+
+    Args:
+        path: Resolved target file path
+        data: Bytes to write
+        mode: Permission bits to copy from the existing target, or None for a new file
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    # 0o666 lets the kernel apply the process umask, like a plain open(..., "w")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            tmp_path.chmod(mode)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
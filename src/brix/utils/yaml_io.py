@@ -0,0 +1,46 @@
+"""YAML load/dump helpers.
+
+Uses the libyaml C bindings (CSafeLoader/CSafeDumper) when PyYAML was built
+with them, falling back to the pure-Python safe loader and dumper otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import Any, BinaryIO
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+YAMLError = yaml.YAMLError
+
+
+def load_yaml(content: str | BinaryIO) -> Any:  # noqa: ANN401
+    """Parse a YAML document with the safe loader.
+
+    Args:
+        content: YAML string content, or a binary stream (decoded by the loader)
+
+    Returns:
+        Parsed Python data
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any) -> str:  # noqa: ANN401
+    """Serialize data to block-style YAML, preserving key order.
+
+    Args:
+        data: Plain Python data (dicts, lists, scalars)
+
+    Returns:
+        YAML string representation
+    """
+    return yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
@@ -1,20 +1,22 @@
 """Version update checker using GitHub releases."""
 
+import os
 import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import httpx
 from packaging.version import Version
 from pydantic import BaseModel, ValidationError
 
 from brix import __version__
+from brix.utils.files import write_text_atomic
 from brix.utils.logging import get_logger
 
 GITHUB_REPO = "Spycner/brix"
 CACHE_DIR = Path.home() / ".cache" / "brix"
 CACHE_FILE = CACHE_DIR / "version_check.json"
 CHECK_INTERVAL = timedelta(hours=24)
+OFFLINE_ENV_VAR = "BRIX_OFFLINE"
 
 
 class VersionCache(BaseModel):
@@ -22,6 +24,7 @@ class VersionCache(BaseModel):
 
     last_check: datetime
     latest_version: str
+    etag: str | None = None
 
 
 class GitHubRelease(BaseModel):
@@ -31,19 +34,35 @@ class GitHubRelease(BaseModel):
 
 
 def _fetch_and_cache_latest() -> None:
-    """Fetch latest version from GitHub and cache it (runs in background thread)."""
+    """Fetch latest version from GitHub and cache it (runs in background thread).
+
+    Sends the cached ETag so an unchanged release costs a bodiless 304 response.
+    The cache file is replaced atomically, so a concurrent CLI start never reads
+    a half-written file.
+    """
+    # Imported here so only the background refresh pays for loading httpx
+    import httpx
+
     logger = get_logger()
     url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+    cached = _load_cache()
+    headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
     logger.debug("Fetching latest version from %s", url)
     try:
-        resp = httpx.get(url, timeout=5.0, follow_redirects=True)
-        resp.raise_for_status()
-        release = GitHubRelease.model_validate(resp.json())
-        latest = release.tag_name.lstrip("v")
-        logger.debug("Latest version from GitHub: %s", latest)
+        resp = httpx.get(url, headers=headers, timeout=5.0, follow_redirects=True)
+        etag = resp.headers.get("ETag")
+        if resp.status_code == httpx.codes.NOT_MODIFIED and cached:
+            latest = cached.latest_version
+            etag = etag or cached.etag
+            logger.debug("Latest version unchanged (304): %s", latest)
+        else:
+            resp.raise_for_status()
+            release = GitHubRelease.model_validate(resp.json())
+            latest = release.tag_name.lstrip("v")
+            logger.debug("Latest version from GitHub: %s", latest)
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        cache = VersionCache(last_check=datetime.now(timezone.utc), latest_version=latest)
-        CACHE_FILE.write_text(cache.model_dump_json())
+        cache = VersionCache(last_check=datetime.now(timezone.utc), latest_version=latest, etag=etag)
+        write_text_atomic(CACHE_FILE, cache.model_dump_json())
         logger.debug("Version cache updated at %s", CACHE_FILE)
     except (httpx.HTTPError, ValidationError, OSError) as e:
         logger.debug("Failed to fetch/cache version: %s", e)
@@ -52,13 +71,13 @@ def _fetch_and_cache_latest() -> None:
 def _load_cache() -> VersionCache | None:
     """Load cached version check result."""
     logger = get_logger()
-    if not CACHE_FILE.exists():
-        logger.debug("Version cache file not found: %s", CACHE_FILE)
-        return None
     try:
-        cache = VersionCache.model_validate_json(CACHE_FILE.read_text())
+        cache = VersionCache.model_validate_json(CACHE_FILE.read_bytes())
         logger.debug("Loaded version cache: %s (checked %s)", cache.latest_version, cache.last_check)
         return cache
+    except FileNotFoundError:
+        logger.debug("Version cache file not found: %s", CACHE_FILE)
+        return None
     except (ValidationError, OSError) as e:
         logger.debug("Failed to load version cache: %s", e)
         return None
@@ -75,13 +94,15 @@ def check_for_updates() -> str | None:
     """Check for updates (non-blocking).
 
     Returns latest version if update available (from cache).
-    Spawns background thread to refresh cache if stale.
+    Spawns background thread to refresh cache if stale, unless BRIX_OFFLINE=1.
     """
     logger = get_logger()
     cache = _load_cache()
 
     # Spawn background refresh if needed (non-blocking)
-    if _should_refresh(cache):
+    if os.environ.get(OFFLINE_ENV_VAR) == "1":
+        logger.debug("%s=1, skipping version cache refresh", OFFLINE_ENV_VAR)
+    elif _should_refresh(cache):
         logger.debug("Version cache stale, spawning background refresh")
         thread = threading.Thread(target=_fetch_and_cache_latest, daemon=True)
         thread.start()
@@ -22,3 +22,16 @@ def temp_cache_dir(tmp_path, monkeypatch):
     monkeypatch.setattr(version_check, "CACHE_DIR", cache_dir)
     monkeypatch.setattr(version_check, "CACHE_FILE", cache_file)
     return cache_file
+
+
+@pytest.fixture
+def temp_hub_cache_dir(tmp_path, monkeypatch):
+    """Use temporary directory for dbt Hub registry cache."""
+    from brix.modules.dbt.project import registry_cache
+    from brix.modules.dbt.project.service import get_package_version
+
+    cache_dir = tmp_path / ".cache" / "brix" / "hub"
+    monkeypatch.setattr(registry_cache, "CACHE_DIR", cache_dir)
+    get_package_version.cache_clear()
+    yield cache_dir
+    get_package_version.cache_clear()
@@ -1,8 +1,11 @@
 """Tests for dbt passthrough command."""
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 import brix.commands.dbt as dbt_command_module
@@ -182,3 +185,66 @@ class TestDbtCommand:
             result = runner.invoke(app, ["dbt", "run"])
             mock_run_dbt.assert_called_once_with(["run"], project_path=project_dir.resolve())
             assert result.exit_code == 0
+
+
+class TestLazyReexports:
+    """Tests for lazy re-exports in brix.modules.dbt."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ resolves to the submodule object."""
+        import brix.modules.dbt as dbt_module
+        from brix.modules.dbt import passthrough, profile
+
+        for name in dbt_module.__all__:
+            source = passthrough if hasattr(passthrough, name) else profile
+            assert getattr(dbt_module, name) is getattr(source, name)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError."""
+        import brix.modules.dbt as dbt_module
+
+        with pytest.raises(AttributeError):
+            _ = dbt_module.not_a_real_name
+
+    def test_import_does_not_load_submodules(self):
+        """Importing the package leaves profile editing and passthrough unloaded."""
+        code = (
+            "import sys, brix.modules.dbt; "
+            "print(any(m in sys.modules for m in ('brix.modules.dbt.profile.editor', 'brix.modules.dbt.passthrough')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_profile_commands_do_not_load_questionary(self):
+        """The profile command module defers the interactive editor and questionary."""
+        code = "import sys, brix.commands.dbt.profile; print('questionary' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_profile_package_resolves_interactive_editor(self):
+        """run_interactive_edit is still importable from the profile package."""
+        from brix.modules.dbt.profile import prompts, run_interactive_edit
+
+        assert run_interactive_edit is prompts.run_interactive_edit
+
+    def test_dir_lists_exports(self):
+        """dir() includes lazily exported names."""
+        import brix.modules.dbt as dbt_module
+
+        assert set(dbt_module.__all__) <= set(dir(dbt_module))
+
+
+class TestLazySubcommands:
+    """Tests for lazy registration of the dbt command group."""
+
+    def test_main_import_skips_dbt_commands(self):
+        """Importing brix.main does not import the dbt command modules."""
+        code = "import sys, brix.main; print('brix.commands.dbt' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_root_help_lists_dbt(self):
+        """Root help still lists the lazily loaded dbt group."""
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        assert "dbt" in result.stdout
@@ -1,5 +1,7 @@
 """Tests for dbt profile editor CRUD operations."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 from typer.testing import CliRunner
 
@@ -23,6 +25,16 @@ from brix.modules.dbt.profile import (
     update_output,
     update_profile_target,
 )
+from brix.modules.dbt.profile.prompts import (
+    ProfileSession,
+    _edit_output_loop,
+    _handle_duckdb_action,
+    _parse_extensions,
+    _parse_setting,
+    _prompt_databricks_connection,
+    _prompt_form,
+    _prompt_settings,
+)
 
 runner = CliRunner()
 
@@ -81,6 +93,23 @@ class TestLoadSaveProfiles:
         loaded = load_profiles(profile_path)
         assert "default" in loaded.root
 
+    def test_load_profiles_reuses_parse(self, profiles_file, monkeypatch):
+        load_profiles(profiles_file)
+
+        def fail(*_args):
+            raise AssertionError("profiles were re-parsed")
+
+        monkeypatch.setattr(DbtProfiles, "from_file", fail)
+        first = load_profiles(profiles_file)
+        del first.root["other"]
+        assert "other" in load_profiles(profiles_file).root
+
+    def test_save_profiles_invalidates_cache(self, profiles_file):
+        profiles = load_profiles(profiles_file)
+        delete_profile(profiles, "other")
+        save_profiles(profiles, profiles_file)
+        assert "other" not in load_profiles(profiles_file).root
+
     def test_save_profiles_creates_parent_dirs(self, tmp_path, sample_profiles):
         profile_path = tmp_path / "deep" / "nested" / "profiles.yml"
         save_profiles(sample_profiles, profile_path)
@@ -236,6 +265,119 @@ class TestGetOutput:
             get_output(sample_profiles, "default", "nonexistent")
 
 
+class TestProfileSession:
+    """Tests for buffered saves in the interactive editor."""
+
+    def test_flushes_once_on_exit(self, profiles_file):
+        profiles = load_profiles(profiles_file)
+        with ProfileSession(profiles, profiles_file) as session:
+            update_output(session.profiles, "default", "dev", threads=8)
+            session.mark_dirty()
+            assert load_profiles(profiles_file).root["default"].outputs["dev"].threads == 1
+        assert load_profiles(profiles_file).root["default"].outputs["dev"].threads == 8
+
+    def test_clean_session_does_not_write(self, profiles_file):
+        mtime = profiles_file.stat().st_mtime_ns
+        with ProfileSession(load_profiles(profiles_file), profiles_file):
+            pass
+        assert profiles_file.stat().st_mtime_ns == mtime
+
+    def test_invalid_buffered_edit_is_reported_not_raised(self, tmp_path, capsys):
+        profiles_file = tmp_path / "profiles.yml"
+        profiles_file.write_text(
+            "default:\n"
+            "  target: dev\n"
+            "  outputs:\n"
+            "    dev:\n"
+            "      type: databricks\n"
+            "      host: example.databricks.com\n"
+            "      http_path: /sql/1.0/warehouses/abc\n"
+            "      schema: main\n"
+            "      auth_type: oauth\n"
+        )
+        original = profiles_file.read_text()
+        with (
+            patch("brix.modules.dbt.profile.prompts.prompt_databricks_output_action", side_effect=["token", "back"]),
+            patch("questionary.password", return_value=_answering("dapi123")),
+        ):
+            _edit_output_loop(load_profiles(profiles_file), profiles_file, "default", "dev")
+        assert "Error:" in capsys.readouterr().err
+        assert profiles_file.read_text() == original
+
+    def test_duckdb_action_dispatches_with_current_value(self, profiles_file):
+        session = ProfileSession(load_profiles(profiles_file), profiles_file)
+        output = get_output(session.profiles, "default", "dev")
+        with patch("questionary.text", return_value=_answering("new.duckdb")) as mock_text:
+            _handle_duckdb_action("path", session, "default", "dev", output)
+        assert mock_text.call_args.kwargs["default"] == "dev.duckdb"
+        assert get_output(session.profiles, "default", "dev").path == "new.duckdb"
+        assert session.dirty
+
+
+def _answering(answer: object) -> MagicMock:
+    question = MagicMock()
+    question.ask.return_value = answer
+    return question
+
+
+class TestPromptForm:
+    """Tests for the single-pass form helper."""
+
+    def test_returns_answers(self):
+        with patch("questionary.form", return_value=_answering({"path": "a.duckdb"})):
+            assert _prompt_form(path=MagicMock()) == {"path": "a.duckdb"}
+
+    def test_cancelled_form_returns_none(self):
+        with patch("questionary.form", return_value=_answering({})):
+            assert _prompt_form(path=MagicMock()) is None
+
+    def test_databricks_connection_requires_fields(self):
+        answers = {"host": "h", "http_path": "", "schema": "s", "catalog": ""}
+        with patch("questionary.form", return_value=_answering(answers)):
+            assert _prompt_databricks_connection() is None
+
+    def test_databricks_connection_rejects_empty_required_fields_inline(self):
+        answers = {"host": "h", "http_path": "/p", "schema": "s", "catalog": ""}
+        with (
+            patch("questionary.text") as mock_text,
+            patch("questionary.form", return_value=_answering(answers)),
+        ):
+            _prompt_databricks_connection()
+        validators = {call.args[0]: call.kwargs.get("validate") for call in mock_text.call_args_list}
+        for label in ("Host:", "HTTP path:", "Schema:"):
+            assert validators[label]("  ") is not True
+            assert validators[label]("value") is True
+        assert validators["Catalog (optional):"] is None
+
+    def test_databricks_connection_empty_catalog_is_none(self):
+        answers = {"host": "h", "http_path": "/p", "schema": "s", "catalog": ""}
+        with patch("questionary.form", return_value=_answering(answers)):
+            assert _prompt_databricks_connection() == ("h", "/p", "s", None)
+
+
+class TestSettingParsers:
+    """Tests for DuckDB settings and extensions parsing."""
+
+    def test_parse_setting_strips_whitespace(self):
+        assert _parse_setting("  memory_limit = 4GB ") == ("memory_limit", "4GB")
+
+    def test_parse_setting_keeps_equals_in_value(self):
+        assert _parse_setting("search_path=a=b") == ("search_path", "a=b")
+
+    @pytest.mark.parametrize("value", ["no_equals", "=value", "   =value"])
+    def test_parse_setting_invalid(self, value):
+        assert _parse_setting(value) is None
+
+    def test_parse_extensions(self):
+        assert _parse_extensions(" httpfs, parquet,,") == ["httpfs", "parquet"]
+        assert _parse_extensions("  ") == []
+
+    def test_prompt_settings_parses_pasted_lines(self):
+        pasted = "threads=4\n\nbroken\nmemory_limit = 2GB\n"
+        with patch("questionary.text", return_value=_answering(pasted)):
+            assert _prompt_settings() == {"threads": "4", "memory_limit": "2GB"}
+
+
 class TestEditCommand:
     """Tests for the edit CLI command."""
 
@@ -1,7 +1,9 @@
 """Tests for dbt project commands and models."""
 
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
@@ -17,6 +19,7 @@ from brix.modules.dbt.project.models import (
     validate_project_name,
 )
 from brix.modules.dbt.project.service import (
+    POPULAR_PACKAGES,
     ProjectExistsError,
     init_project,
     resolve_project_path,
@@ -51,6 +54,8 @@ class TestProjectNameValidation:
             "my.project",  # dots not allowed
             "",  # empty not allowed
             "project@name",  # special chars not allowed
+            "projé",  # non-ASCII identifiers not allowed
+            "project\n",  # trailing newline not allowed
         ]
         for name in invalid_names:
             with pytest.raises(ProjectNameError):
@@ -108,6 +113,12 @@ test-paths: ["tests"]
         assert project.test_paths == ["tests"]
         assert project.clean_targets == ["target", "dbt_packages"]
 
+    def test_default_paths_not_shared(self):
+        """Test each instance gets its own default path lists."""
+        project = DbtProject(name="test", profile="default")
+        project.model_paths.append("staging")
+        assert DbtProject(name="other", profile="default").model_paths == ["models"]
+
     def test_project_with_models_config(self):
         """Test project with models configuration."""
         project = DbtProject(
@@ -180,6 +191,20 @@ packages:
         packages = DbtPackages.from_yaml("")
         assert packages.packages == []
 
+    def test_unknown_package_source_rejected(self):
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError, match="must have a 'package', 'git', or 'local' key") as exc_info:
+            DbtPackages.from_yaml("packages:\n  - tarball: https://example.com/pkg.tar.gz\n")
+        assert exc_info.value.error_count() == 1
+
+    def test_invalid_git_package_reports_git_errors_only(self):
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError) as exc_info:
+            DbtPackages.from_yaml("packages:\n  - git: https://github.com/org/repo.git\n")
+        assert [error["loc"] for error in exc_info.value.errors()] == [("packages", 0, "git", "revision")]
+
     def test_add_hub_package(self):
         packages = DbtPackages()
         packages.add_hub_package("dbt-labs/dbt_utils", ">=1.0.0")
@@ -385,6 +410,19 @@ class TestProjectCli:
         assert "Project created" in result.stdout or "Project initialization complete" in result.stdout
         assert (tmp_path / "test_cli_project" / "dbt_project.yml").exists()
 
+    def test_project_init_cli_mode_does_not_load_questionary(self, tmp_path):
+        """CLI mode without --run-deps never imports the interactive prompts."""
+        args = ["dbt", "project", "init", "-n", "lazy_project", "-b", str(tmp_path), "-p", "default", "--no-run-deps"]
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from brix.main import app\n"
+            f"result = CliRunner().invoke(app, {args!r})\n"
+            "print(result.exit_code, 'questionary' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "0 False"
+
     def test_project_init_with_team(self, tmp_path):
         """Test CLI mode with team option."""
         result = runner.invoke(
@@ -425,3 +463,167 @@ class TestProjectCli:
         )
         assert result.exit_code == 1
         assert "Invalid project name" in result.stdout or "must start with" in result.stdout
+
+
+class TestProjectEditCli:
+    """Tests for non-interactive project edit actions."""
+
+    @pytest.fixture
+    def project_file(self, tmp_path):
+        """Create a minimal dbt_project.yml."""
+        project_path = tmp_path / "dbt_project.yml"
+        project_path.write_text("name: my_project\nprofile: default\n")
+        return project_path
+
+    def _edit(self, project_file, *args):
+        return runner.invoke(app, ["dbt", "project", "edit", "-p", str(project_file), "--action", *args])
+
+    def test_set_name(self, project_file):
+        """Test set-name dispatches to the project field update."""
+        result = self._edit(project_file, "set-name", "--name", "renamed")
+        assert result.exit_code == 0
+        assert "name: renamed" in project_file.read_text()
+
+    def test_set_name_requires_value(self, project_file):
+        """Test set-name fails without --name."""
+        result = self._edit(project_file, "set-name")
+        assert result.exit_code == 1
+        assert "--name is required" in result.stdout
+
+    def test_add_and_remove_path_share_handler(self, project_file):
+        """Test add-path and remove-path both dispatch to the path handler."""
+        result = self._edit(project_file, "add-path", "--path-field", "model-paths", "--path", "staging")
+        assert result.exit_code == 0
+        assert "staging" in project_file.read_text()
+
+        result = self._edit(project_file, "remove-path", "--path-field", "model-paths", "--path", "staging")
+        assert result.exit_code == 0
+        assert "staging" not in project_file.read_text()
+
+    def test_package_actions(self, project_file):
+        """Test add-local-package, update and remove dispatch to package handlers."""
+        result = self._edit(project_file, "add-local-package", "--package", "../shared")
+        assert result.exit_code == 0
+        assert "../shared" in (project_file.parent / "packages.yml").read_text()
+
+        result = self._edit(project_file, "remove-package", "--package", "../shared")
+        assert result.exit_code == 0
+        assert "../shared" not in (project_file.parent / "packages.yml").read_text()
+
+    def test_update_missing_package_fails(self, project_file):
+        """Test update-package-version reports a missing package."""
+        result = self._edit(project_file, "update-package-version", "--package", "a/b", "--package-version", ">=1.0.0")
+        assert result.exit_code == 1
+
+
+class TestPromptAddHubPackageDetails:
+    """Tests for the interactive hub package prompt."""
+
+    @staticmethod
+    def _answering(answer: object) -> MagicMock:
+        question = MagicMock()
+        question.ask.return_value = answer
+        return question
+
+    def _run(self, selected: str, custom_name: str | None = None) -> tuple[tuple[str, str] | None, list[str]]:
+        from brix.modules.dbt.project import prompts
+
+        calls: list[str] = []
+
+        def fake_version(package: str) -> str:
+            calls.append(package)
+            return ">=9.9.9"
+
+        text_answers = [self._answering(custom_name)] if custom_name else []
+        text_answers.append(self._answering(">=9.9.9"))
+        with (
+            patch.object(prompts, "get_package_version", side_effect=fake_version),
+            patch("questionary.select", return_value=self._answering(selected)),
+            patch("questionary.text", side_effect=text_answers),
+        ):
+            result = prompts.prompt_add_hub_package_details()
+        return result, calls
+
+    def test_popular_package_looks_up_only_selection(self):
+        """Only the chosen popular package is looked up on the hub."""
+        package = POPULAR_PACKAGES[1][0]
+        result, calls = self._run(package)
+        assert result == (package, ">=9.9.9")
+        assert calls == [package]
+
+    def test_custom_package_looks_up_only_entered_name(self):
+        """A custom package name is looked up after it is entered, with no other requests."""
+        result, calls = self._run("_custom_", custom_name="acme/dbt_custom")
+        assert result == ("acme/dbt_custom", ">=9.9.9")
+        assert calls == ["acme/dbt_custom"]
+
+
+class TestPromptProfilePath:
+    """Tests for the profiles.yml location prompt."""
+
+    def test_uses_given_default_without_resolving(self, tmp_path):
+        """A caller-supplied default is offered as-is and returned on empty input."""
+        from brix.modules.dbt.project import prompts
+
+        default = tmp_path / "profiles.yml"
+        with (
+            patch.object(prompts, "get_default_profile_path") as mock_default,
+            patch("questionary.text") as mock_text,
+        ):
+            mock_text.return_value.ask.return_value = ""
+            assert prompts.prompt_profile_path(default) == default
+        mock_default.assert_not_called()
+        assert mock_text.call_args.kwargs["default"] == str(default)
+
+
+class TestPromptSelectPackage:
+    """Tests for interactive package selection."""
+
+    def test_single_package_selected_without_prompt(self):
+        """A lone package is returned without opening a selection menu."""
+        from brix.modules.dbt.project.prompts import prompt_select_package
+
+        packages = DbtPackages()
+        packages.add_local_package("../shared")
+        with patch("questionary.select") as mock_select:
+            assert prompt_select_package(packages) == "../shared"
+        mock_select.assert_not_called()
+
+    def test_multiple_packages_prompt(self):
+        """Several packages still open the selection menu."""
+        from brix.modules.dbt.project.prompts import prompt_select_package
+
+        packages = DbtPackages()
+        packages.add_local_package("../shared")
+        packages.add_local_package("../other")
+        with patch("questionary.select") as mock_select:
+            mock_select.return_value.ask.return_value = "../other"
+            assert prompt_select_package(packages) == "../other"
+        mock_select.assert_called_once()
+
+
+class TestHandlePackageAction:
+    """Tests for package menu dispatch in the interactive editor."""
+
+    def test_add_local_marks_packages_dirty(self, tmp_path):
+        from brix.modules.dbt.project.prompts import ProjectSession, _handle_package_action
+
+        session = ProjectSession(
+            DbtProject(name="demo", profile="default"), DbtPackages(), tmp_path / "dbt_project.yml"
+        )
+        with patch("questionary.text") as mock_text:
+            mock_text.return_value.ask.return_value = "../shared"
+            _handle_package_action("add_local", session)
+        assert [pkg.identifier for pkg in session.packages.packages] == ["../shared"]
+        assert session.packages_dirty
+        assert not session.project_dirty
+
+    def test_update_version_rejects_non_hub_package(self, tmp_path, capsys):
+        from brix.modules.dbt.project.prompts import ProjectSession, _handle_package_action
+
+        packages = DbtPackages()
+        packages.add_local_package("../shared")
+        session = ProjectSession(DbtProject(name="demo", profile="default"), packages, tmp_path / "dbt_project.yml")
+        _handle_package_action("update_version", session)
+        assert "Can only update version for hub packages." in capsys.readouterr().err
+        assert not session.packages_dirty
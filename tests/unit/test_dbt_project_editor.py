@@ -56,6 +56,39 @@ version: "1.0.0"
         with pytest.raises(ProjectNotFoundError):
             load_project(project_file)
 
+    def test_load_project_reuses_parse(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test unchanged project files are parsed only once."""
+        project_file = tmp_path / "dbt_project.yml"
+        project_file.write_text("name: cached_project\nprofile: default\n")
+        load_project(project_file)
+
+        def fail(*_args: object) -> DbtProject:
+            raise AssertionError("project was re-parsed")
+
+        monkeypatch.setattr(DbtProject, "from_file", fail)
+        first = load_project(project_file)
+        first.name = "mutated"
+        assert load_project(project_file).name == "cached_project"
+
+    def test_reload_and_save_keep_yaml_types(self, tmp_path: Path) -> None:
+        """Test YAML-native values such as dates survive a load/save round trip."""
+        project_file = tmp_path / "dbt_project.yml"
+        project_file.write_text("name: dated\nprofile: default\nvars:\n  start_date: 2020-01-01\n")
+        load_project(project_file)
+
+        save_project(load_project(project_file), project_file)
+
+        assert "start_date: 2020-01-01\n" in project_file.read_text()
+
+    def test_save_project_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test saving a project is visible to the next load."""
+        project_file = tmp_path / "dbt_project.yml"
+        save_project(DbtProject(name="before", profile="default"), project_file)
+        assert load_project(project_file).name == "before"
+
+        save_project(DbtProject(name="after_save", profile="default"), project_file)
+        assert load_project(project_file).name == "after_save"
+
     def test_save_project(self, tmp_path: Path) -> None:
         """Test saving a project."""
         project_file = tmp_path / "dbt_project.yml"
@@ -68,6 +101,17 @@ version: "1.0.0"
         assert "new_project" in content
         assert "test" in content
 
+    def test_save_rejects_invalid_assignment(self, tmp_path: Path) -> None:
+        """Test invalid directly-assigned fields are caught before writing."""
+        project_file = tmp_path / "dbt_project.yml"
+        project = DbtProject(name="new_project", profile="test")
+        project.name = "not valid!"
+
+        with pytest.raises(ValueError, match="not valid"):
+            save_project(project, project_file)
+
+        assert not project_file.exists()
+
     def test_save_creates_parent_dirs(self, tmp_path: Path) -> None:
         """Test saving creates parent directories."""
         project_file = tmp_path / "nested" / "dir" / "dbt_project.yml"
@@ -189,6 +233,25 @@ class TestUpdatePathField:
 
         assert updated.model_paths == ["new_models", "staging"]
 
+    def test_add_and_remove_edit_path_list_in_place(self) -> None:
+        """Test add/remove keep the same list object the interactive editor displays."""
+        project = DbtProject(name="test", profile="default")
+        paths = project.model_paths
+
+        update_path_field(project, "model_paths", "add", "staging")
+        update_path_field(project, "model_paths", "remove", "models")
+
+        assert project.model_paths is paths
+        assert paths == ["staging"]
+
+    def test_set_paths_drops_duplicates(self) -> None:
+        """Test setting paths keeps the first occurrence of each path."""
+        project = DbtProject(name="test", profile="default")
+
+        updated = update_path_field(project, "model_paths", "set", ["staging", "models", "staging"])
+
+        assert updated.model_paths == ["staging", "models"]
+
     def test_invalid_path_field_raises(self) -> None:
         """Test invalid path field raises error."""
         project = DbtProject(name="test", profile="default")
@@ -384,6 +447,35 @@ class TestPackageHelpers:
         assert has_package(mixed_packages, "dbt-labs/dbt_utils") is True
         assert has_package(mixed_packages, "nonexistent") is False
 
+    def test_find_package_index_tracks_list_mutation(self, mixed_packages: DbtPackages) -> None:
+        """Test lookups follow direct edits to the packages list."""
+        assert find_package_index(mixed_packages, "../shared") == 2
+
+        mixed_packages.packages.pop(0)
+        assert find_package_index(mixed_packages, "../shared") == 1
+
+        mixed_packages.packages.append(LocalPackage(local="../other"))
+        assert find_package_index(mixed_packages, "../other") == 2
+
+        mixed_packages.packages[0], mixed_packages.packages[1] = mixed_packages.packages[1], mixed_packages.packages[0]
+        assert find_package_index(mixed_packages, "../shared") == 0
+
+    def test_remove_then_add_is_found(self, mixed_packages: DbtPackages) -> None:
+        """Test a package added after a removal is found and cannot be added twice."""
+        remove_package(mixed_packages, "../shared")
+        add_local_package(mixed_packages, "../other")
+
+        assert has_package(mixed_packages, "../other") is True
+        assert find_package_index(mixed_packages, "../other") == 2
+        with pytest.raises(PackageAlreadyExistsError):
+            add_local_package(mixed_packages, "../other")
+
+    def test_find_package_index_returns_first_duplicate(self) -> None:
+        """Test duplicates resolve to the first occurrence."""
+        packages = DbtPackages(packages=[LocalPackage(local="../a"), LocalPackage(local="../a")])
+
+        assert find_package_index(packages, "../a") == 0
+
     def test_get_package_display_info(self, mixed_packages: DbtPackages) -> None:
         """Test getting package display info."""
         info = get_package_display_info(mixed_packages)
@@ -402,3 +494,82 @@ class TestPackageHelpers:
         info = get_package_display_info(packages)
 
         assert info[0] == ("https://github.com/org/repo.git", "git: main (pkg)")
+
+
+class TestProjectSession:
+    """Tests for buffered saves in the interactive project editor."""
+
+    @pytest.fixture
+    def project_file(self, tmp_path: Path) -> Path:
+        """Create a minimal dbt_project.yml."""
+        project_file = tmp_path / "dbt_project.yml"
+        project_file.write_text("name: test_project\nprofile: default\n")
+        return project_file
+
+    def test_flushes_once_on_exit(self, project_file: Path) -> None:
+        """Test edits are written when the session exits, not before."""
+        from brix.modules.dbt.project.prompts import ProjectSession
+
+        session = ProjectSession(load_project(project_file), DbtPackages(), project_file)
+        with session:
+            session.project = update_path_field(session.project, "model_paths", "add", "staging")
+            session.mark_project_dirty()
+            session.packages = add_hub_package(session.packages, "dbt-labs/dbt_utils", "1.0.0")
+            session.mark_packages_dirty()
+            assert load_project(project_file).model_paths == ["models"]
+            assert not (project_file.parent / "packages.yml").exists()
+
+        assert load_project(project_file).model_paths == ["models", "staging"]
+        assert has_package(load_packages(project_file), "dbt-labs/dbt_utils")
+        assert not session.project_dirty
+        assert not session.packages_dirty
+
+    def test_clean_session_does_not_write(self, project_file: Path) -> None:
+        """Test a session without edits leaves both files untouched."""
+        from brix.modules.dbt.project.prompts import ProjectSession
+
+        mtime = project_file.stat().st_mtime_ns
+        with ProjectSession(load_project(project_file), DbtPackages(), project_file):
+            pass
+        assert project_file.stat().st_mtime_ns == mtime
+        assert not (project_file.parent / "packages.yml").exists()
+
+    def test_failed_save_is_reported_and_retried(
+        self, project_file: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a save error is echoed, keeps the edit pending, and the next exit retries."""
+        from brix.modules.dbt.project import prompts
+
+        def fail(*_args: object) -> None:
+            raise PermissionError("read-only")
+
+        session = prompts.ProjectSession(load_project(project_file), DbtPackages(), project_file)
+        monkeypatch.setattr(prompts, "save_project", fail)
+        with session:
+            session.project = update_path_field(session.project, "model_paths", "add", "staging")
+            session.mark_project_dirty()
+
+        assert "Error saving changes: read-only" in capsys.readouterr().err
+        assert session.project_dirty
+
+        monkeypatch.setattr(prompts, "save_project", save_project)
+        with session:
+            pass
+        assert not session.project_dirty
+        assert load_project(project_file).model_paths == ["models", "staging"]
+
+    def test_package_display_info_refreshes_after_edit(self, project_file: Path) -> None:
+        """Test display info is reused until packages are marked dirty."""
+        from brix.modules.dbt.project.prompts import ProjectSession
+
+        session = ProjectSession(load_project(project_file), DbtPackages(), project_file)
+        session.packages = add_local_package(session.packages, "../shared")
+        session.mark_packages_dirty()
+        first = session.package_display_info()
+        assert session.package_display_info() is first
+
+        session.packages = update_package_version(
+            add_hub_package(session.packages, "dbt-labs/dbt_utils", "1.0.0"), "dbt-labs/dbt_utils", "1.1.0"
+        )
+        session.mark_packages_dirty()
+        assert session.package_display_info() == [("../shared", "local"), ("dbt-labs/dbt_utils", "hub: 1.1.0")]
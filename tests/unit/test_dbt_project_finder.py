@@ -1,5 +1,9 @@
 """Unit tests for dbt project finder module."""
 
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,19 +12,40 @@ import pytest
 from brix.modules.dbt.project.finder import (
     EXCLUDE_DIRS,
     _format_project_choice,
-    _should_exclude,
+    _resolve_search_root,
     find_dbt_projects,
     get_search_root,
+    prompt_select_project,
 )
 
 
 class TestGetSearchRoot:
     """Tests for get_search_root function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        _resolve_search_root.cache_clear()
+        yield
+        _resolve_search_root.cache_clear()
+
     def test_in_git_repo(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test returns git root when in a git repo."""
+        """Test returns git root found by walking parents, without spawning git."""
+        git_root = tmp_path / "repo"
+        (git_root / ".git").mkdir(parents=True)
+        (git_root / "sub").mkdir()
+        monkeypatch.chdir(git_root / "sub")
+
+        with patch("subprocess.run") as mock_run:
+            result = get_search_root()
+
+            assert result == git_root
+            mock_run.assert_not_called()
+
+    def test_falls_back_to_git(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test asks git when no .git entry is found in the parents."""
         git_root = tmp_path / "repo"
         git_root.mkdir()
+        monkeypatch.chdir(tmp_path)
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
@@ -32,8 +57,6 @@ class TestGetSearchRoot:
 
     def test_not_in_git_repo(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test returns cwd when not in a git repo."""
-        import subprocess
-
         monkeypatch.chdir(tmp_path)
 
         with patch("subprocess.run") as mock_run:
@@ -43,39 +66,21 @@ class TestGetSearchRoot:
 
             assert result == tmp_path
 
+    def test_result_is_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test git is only consulted once per working directory."""
+        monkeypatch.chdir(tmp_path)
 
-class TestShouldExclude:
-    """Tests for _should_exclude function."""
-
-    def test_excludes_venv(self) -> None:
-        """Test excludes .venv directory."""
-        path = Path("/project/.venv/some/path")
-        assert _should_exclude(path) is True
-
-    def test_excludes_node_modules(self) -> None:
-        """Test excludes node_modules directory."""
-        path = Path("/project/node_modules/package/file")
-        assert _should_exclude(path) is True
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(1, "git")
 
-    def test_excludes_dbt_packages(self) -> None:
-        """Test excludes dbt_packages directory."""
-        path = Path("/project/dbt_packages/dbt_utils/file")
-        assert _should_exclude(path) is True
+            get_search_root()
+            get_search_root()
 
-    def test_excludes_target(self) -> None:
-        """Test excludes target directory."""
-        path = Path("/project/target/compiled/file")
-        assert _should_exclude(path) is True
+            mock_run.assert_called_once()
 
-    def test_excludes_git(self) -> None:
-        """Test excludes .git directory."""
-        path = Path("/project/.git/objects/file")
-        assert _should_exclude(path) is True
 
-    def test_does_not_exclude_normal_path(self) -> None:
-        """Test does not exclude normal project paths."""
-        path = Path("/project/models/staging/file.sql")
-        assert _should_exclude(path) is False
+class TestExcludeDirs:
+    """Tests for the EXCLUDE_DIRS constant."""
 
     def test_exclude_dirs_constant(self) -> None:
         """Test EXCLUDE_DIRS contains expected values."""
@@ -166,6 +171,25 @@ class TestFindDbtProjects:
         assert len(projects) == 1
         assert "shallow" in str(projects[0])
 
+    def test_does_not_descend_into_excluded_dirs(self, tmp_path: Path) -> None:
+        """Test excluded directories are pruned instead of scanned."""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "models").mkdir()
+
+        scanned: list[str] = []
+        real_scandir = os.scandir
+
+        def spy(path: str) -> object:
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=spy):
+            find_dbt_projects(tmp_path)
+
+        assert "models" in scanned
+        assert "node_modules" not in scanned
+        assert "pkg" not in scanned
+
     def test_returns_empty_if_none_found(self, tmp_path: Path) -> None:
         """Test returns empty list if no projects found."""
         projects = find_dbt_projects(tmp_path)
@@ -227,3 +251,37 @@ class TestFormatProjectChoice:
 
         # Should fall back to absolute path parent
         assert str(project_path.parent) in result
+
+    def test_does_not_match_sibling_with_common_prefix(self, tmp_path: Path) -> None:
+        """Test a sibling directory sharing the root's name prefix is not treated as inside it."""
+        root = tmp_path / "repo"
+        project_path = tmp_path / "repo2" / "proj" / "dbt_project.yml"
+
+        result = _format_project_choice(project_path, root)
+
+        assert result == str(project_path.parent)
+
+
+class TestPromptSelectProject:
+    """Tests for prompt_select_project function."""
+
+    def test_finder_import_defers_questionary(self) -> None:
+        """Test importing the finder does not load questionary until a prompt is shown."""
+        code = "import sys, brix.modules.dbt.project.finder; print('questionary' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_ambiguous_names_use_full_paths(self, tmp_path: Path) -> None:
+        """Test every project with a colliding display name is shown by full path."""
+        root = tmp_path / "repo"
+        root_project = root / "dbt_project.yml"
+        nested_project = root / "repo" / "dbt_project.yml"
+        other_project = root / "other" / "dbt_project.yml"
+
+        with patch("questionary.select") as mock_select:
+            mock_select.return_value.ask.return_value = str(root)
+            selected = prompt_select_project([root_project, nested_project, other_project], root)
+
+        choices = mock_select.call_args.kwargs["choices"]
+        assert choices == [str(root), str(root / "repo"), "other"]
+        assert selected == root_project
@@ -0,0 +1,87 @@
+"""Tests for dbt Hub registry cache."""
+
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from brix.modules.dbt.project import registry_cache
+from brix.modules.dbt.project.registry_cache import get_cache_file, load_cached_package, save_cached_package
+from brix.modules.dbt.project.service import (
+    fetch_package_version,
+    fetch_package_versions_parallel,
+    get_package_version,
+    iter_package_versions,
+)
+
+
+def _hub_response(payload: dict) -> MagicMock:
+    response = MagicMock()
+    response.read.return_value = json.dumps(payload).encode()
+    response.__enter__.return_value = response
+    return response
+
+
+class TestRegistryCache:
+    def test_cache_file_name(self, temp_hub_cache_dir):
+        assert get_cache_file("dbt-labs/dbt_utils") == temp_hub_cache_dir / "dbt-labs__dbt_utils.json"
+
+    def test_missing_cache_returns_none(self, temp_hub_cache_dir):
+        assert load_cached_package("dbt-labs/dbt_utils") is None
+
+    def test_roundtrip_keeps_full_payload(self, temp_hub_cache_dir):
+        payload = {"name": "dbt_utils", "version": "1.3.0", "packages": []}
+        save_cached_package("dbt-labs/dbt_utils", payload)
+        assert load_cached_package("dbt-labs/dbt_utils") == payload
+
+    def test_save_leaves_no_temp_files(self, temp_hub_cache_dir):
+        save_cached_package("dbt-labs/dbt_utils", {"version": "1.2.0"})
+        save_cached_package("dbt-labs/dbt_utils", {"version": "1.3.0"})
+        assert [p.name for p in temp_hub_cache_dir.iterdir()] == ["dbt-labs__dbt_utils.json"]
+        assert load_cached_package("dbt-labs/dbt_utils") == {"version": "1.3.0"}
+
+    def test_stale_cache_returns_none(self, temp_hub_cache_dir):
+        save_cached_package("dbt-labs/dbt_utils", {"version": "1.3.0"})
+        old = time.time() - registry_cache.CACHE_TTL_SECONDS - 60
+        os.utime(get_cache_file("dbt-labs/dbt_utils"), (old, old))
+        assert load_cached_package("dbt-labs/dbt_utils") is None
+
+    def test_corrupt_cache_returns_none(self, temp_hub_cache_dir):
+        temp_hub_cache_dir.mkdir(parents=True)
+        get_cache_file("dbt-labs/dbt_utils").write_text("not json")
+        assert load_cached_package("dbt-labs/dbt_utils") is None
+
+
+class TestCachedVersionLookup:
+    def test_fetch_writes_cache(self, temp_hub_cache_dir):
+        with patch("urllib.request.urlopen", return_value=_hub_response({"version": "1.3.0"})) as mock_open:
+            assert fetch_package_version("dbt-labs/dbt_utils") == ">=1.3.0"
+            mock_open.assert_called_once()
+        assert load_cached_package("dbt-labs/dbt_utils") == {"version": "1.3.0"}
+
+    def test_fetch_uses_cache(self, temp_hub_cache_dir):
+        save_cached_package("dbt-labs/dbt_utils", {"version": "1.2.0"})
+        with patch("urllib.request.urlopen") as mock_open:
+            assert fetch_package_version("dbt-labs/dbt_utils") == ">=1.2.0"
+            mock_open.assert_not_called()
+
+    def test_get_package_version_memoized(self, temp_hub_cache_dir):
+        with patch("brix.modules.dbt.project.service.fetch_package_version", return_value=">=1.0.0") as mock_fetch:
+            get_package_version("dbt-labs/dbt_utils")
+            get_package_version("dbt-labs/dbt_utils")
+            mock_fetch.assert_called_once()
+
+    def test_parallel_skips_network_when_fully_cached(self, temp_hub_cache_dir):
+        save_cached_package("dbt-labs/dbt_utils", {"version": "1.3.0"})
+        save_cached_package("dbt-labs/codegen", {"version": "0.13.0"})
+        with patch("brix.modules.dbt.project.service.get_package_version") as mock_get:
+            versions = fetch_package_versions_parallel(["dbt-labs/dbt_utils", "dbt-labs/codegen"])
+            mock_get.assert_not_called()
+        assert versions == {"dbt-labs/dbt_utils": ">=1.3.0", "dbt-labs/codegen": ">=0.13.0"}
+
+    def test_iter_yields_cached_before_fetched(self, temp_hub_cache_dir):
+        save_cached_package("dbt-labs/codegen", {"version": "0.13.0"})
+        with patch("brix.modules.dbt.project.service.get_package_version", return_value=">=1.0.0") as mock_get:
+            results = list(iter_package_versions(["dbt-labs/dbt_utils", "dbt-labs/codegen"]))
+            mock_get.assert_called_once_with("dbt-labs/dbt_utils")
+        assert results == [("dbt-labs/codegen", ">=0.13.0"), ("dbt-labs/dbt_utils", ">=1.0.0")]
@@ -0,0 +1,77 @@
+"""Tests for file writing helpers."""
+
+import os
+from unittest.mock import patch
+
+from brix.utils.files import write_text_atomic, write_text_if_changed
+
+
+class TestWriteTextIfChanged:
+    def test_creates_file(self, tmp_path):
+        path = tmp_path / "profiles.yml"
+        assert write_text_if_changed(path, "a: 1\n") is True
+        assert path.read_text() == "a: 1\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["profiles.yml"]
+
+    def test_new_file_uses_umask_mode(self, tmp_path):
+        path = tmp_path / "profiles.yml"
+        write_text_if_changed(path, "a: 1\n")
+        (tmp_path / "plain.yml").write_text("a: 1\n")
+        assert path.stat().st_mode & 0o777 == (tmp_path / "plain.yml").stat().st_mode & 0o777
+
+    def test_skips_identical_content(self, tmp_path):
+        path = tmp_path / "profiles.yml"
+        path.write_text("a: 1\n")
+        os.utime(path, ns=(0, 0))
+        assert write_text_if_changed(path, "a: 1\n") is False
+        assert path.stat().st_mtime_ns == 0
+
+    def test_rewrites_same_size_change(self, tmp_path):
+        path = tmp_path / "profiles.yml"
+        path.write_text("a: 1\n")
+        assert write_text_if_changed(path, "a: 2\n") is True
+        assert path.read_text() == "a: 2\n"
+
+    def test_preserves_permissions(self, tmp_path):
+        path = tmp_path / "profiles.yml"
+        path.write_text("token: old\n")
+        path.chmod(0o600)
+        write_text_if_changed(path, "token: new\n")
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_follows_symlink(self, tmp_path):
+        target = tmp_path / "dotfiles" / "profiles.yml"
+        target.parent.mkdir()
+        target.write_text("a: 1\n")
+        link = tmp_path / "profiles.yml"
+        link.symlink_to(target)
+
+        write_text_if_changed(link, "a: 2\n")
+
+        assert link.is_symlink()
+        assert target.read_text() == "a: 2\n"
+
+
+class TestWriteTextAtomic:
+    def test_replaces_content(self, tmp_path):
+        path = tmp_path / "version_check.json"
+        path.write_text("old")
+        path.chmod(0o640)
+        write_text_atomic(path, "new")
+        assert path.read_text() == "new"
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["version_check.json"]
+
+    def test_always_writes_identical_content(self, tmp_path):
+        path = tmp_path / "version_check.json"
+        path.write_text("same")
+        os.utime(path, ns=(0, 0))
+        write_text_atomic(path, "same")
+        assert path.stat().st_mtime_ns != 0
+
+    def test_new_file_does_not_touch_umask(self, tmp_path):
+        path = tmp_path / "version_check.json"
+        with patch("os.umask", side_effect=AssertionError("umask changed")):
+            write_text_atomic(path, "new")
+        (tmp_path / "plain.json").write_text("new")
+        assert path.stat().st_mode & 0o777 == (tmp_path / "plain.json").stat().st_mode & 0o777
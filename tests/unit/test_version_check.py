@@ -5,8 +5,10 @@ from unittest.mock import patch
 
 import httpx
 import respx
+from typer.testing import CliRunner
 
 from brix import version_check
+from brix.main import app
 from brix.version_check import (
     CHECK_INTERVAL,
     GitHubRelease,
@@ -104,6 +106,17 @@ class TestFetchAndCacheLatest:
         assert cache is not None
         assert cache.latest_version == "1.2.3"
 
+    @respx.mock
+    def test_replaces_cache_atomically(self, temp_cache_dir):
+        temp_cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        temp_cache_dir.write_text("stale")
+        respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(
+            return_value=httpx.Response(200, json={"tag_name": "v2.0.0"})
+        )
+        _fetch_and_cache_latest()
+        assert _load_cache() is not None
+        assert [p.name for p in temp_cache_dir.parent.iterdir()] == [temp_cache_dir.name]
+
     @respx.mock
     def test_http_error(self, temp_cache_dir):
         respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(return_value=httpx.Response(404))
@@ -126,6 +139,33 @@ class TestFetchAndCacheLatest:
         _fetch_and_cache_latest()  # Should not raise
         assert _load_cache() is None
 
+    @respx.mock
+    def test_stores_etag(self, temp_cache_dir):
+        respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(
+            return_value=httpx.Response(200, json={"tag_name": "v2.0.0"}, headers={"ETag": '"abc"'})
+        )
+        _fetch_and_cache_latest()
+        cache = _load_cache()
+        assert cache is not None
+        assert cache.etag == '"abc"'
+
+    @respx.mock
+    def test_not_modified_keeps_cached_version(self, temp_cache_dir):
+        old_time = datetime.now(timezone.utc) - CHECK_INTERVAL - timedelta(hours=1)
+        cache = VersionCache(last_check=old_time, latest_version="2.0.0", etag='"abc"')
+        temp_cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        temp_cache_dir.write_text(cache.model_dump_json())
+        route = respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(
+            return_value=httpx.Response(304)
+        )
+        _fetch_and_cache_latest()
+        assert route.calls.last.request.headers["If-None-Match"] == '"abc"'
+        refreshed = _load_cache()
+        assert refreshed is not None
+        assert refreshed.latest_version == "2.0.0"
+        assert refreshed.etag == '"abc"'
+        assert not _should_refresh(refreshed)
+
 
 class TestCheckForUpdates:
     def test_no_cache_returns_none(self, temp_cache_dir):
@@ -172,3 +212,49 @@ class TestCheckForUpdates:
 
             time.sleep(0.1)
             mock_fetch.assert_called_once()
+
+    def test_offline_skips_refresh(self, temp_cache_dir, monkeypatch):
+        monkeypatch.setenv("BRIX_OFFLINE", "1")
+        with patch.object(version_check.threading, "Thread") as mock_thread:
+            check_for_updates()
+            mock_thread.assert_not_called()
+
+
+class TestMainUpdateCheck:
+    def test_skipped_without_subcommand(self):
+        with patch.object(version_check, "check_for_updates") as mock_check:
+            result = CliRunner().invoke(app, [])
+        assert result.exit_code == 0
+        mock_check.assert_not_called()
+
+    def test_runs_for_subcommand(self, monkeypatch):
+        monkeypatch.setattr("sys.argv", ["brix", "dbt", "profile", "show"])
+        with patch.object(version_check, "check_for_updates", return_value=None) as mock_check:
+            CliRunner().invoke(app, ["dbt", "profile", "show"])
+        mock_check.assert_called_once()
+
+    def test_skipped_for_subcommand_help(self, monkeypatch):
+        monkeypatch.setattr("sys.argv", ["brix", "dbt", "project", "init", "--help"])
+        with patch.object(version_check, "check_for_updates") as mock_check:
+            result = CliRunner().invoke(app, ["dbt", "project", "init", "--help"])
+        assert result.exit_code == 0
+        mock_check.assert_not_called()
+
+    def test_skipped_during_completion(self, monkeypatch):
+        monkeypatch.setenv("_BRIX_COMPLETE", "complete_bash")
+        with patch.object(version_check, "check_for_updates") as mock_check:
+            CliRunner().invoke(app, ["dbt", "profile", "show"])
+        mock_check.assert_not_called()
+
+    def test_skipped_with_flag(self, monkeypatch):
+        monkeypatch.setattr("sys.argv", ["brix", "--no-version-check", "dbt", "profile", "show"])
+        with patch.object(version_check, "check_for_updates") as mock_check:
+            CliRunner().invoke(app, ["--no-version-check", "dbt", "profile", "show"])
+        mock_check.assert_not_called()
+
+    def test_skipped_with_env_var(self, monkeypatch):
+        monkeypatch.setattr("sys.argv", ["brix", "dbt", "profile", "show"])
+        monkeypatch.setenv("BRIX_NO_VERSION_CHECK", "1")
+        with patch.object(version_check, "check_for_updates") as mock_check:
+            CliRunner().invoke(app, ["dbt", "profile", "show"])
+        mock_check.assert_not_called()
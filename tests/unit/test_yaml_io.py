@@ -0,0 +1,28 @@
+"""Tests for YAML load/dump helpers."""
+
+import pytest
+import yaml
+
+from brix.utils.yaml_io import YAMLError, dump_yaml, load_yaml
+
+
+class TestYamlIo:
+    def test_roundtrip_preserves_key_order(self):
+        data = {"name": "proj", "version": "1.0.0", "model-paths": ["models"], "vars": {"b": 1, "a": 2}}
+        content = dump_yaml(data)
+        assert load_yaml(content) == data
+        assert content.index("name:") < content.index("version:") < content.index("model-paths:")
+
+    def test_dump_matches_pure_python_dumper(self):
+        data = {"default": {"target": "dev", "outputs": {"dev": {"type": "duckdb", "threads": 1}}}}
+        assert dump_yaml(data) == yaml.dump(data, default_flow_style=False, sort_keys=False)
+
+    def test_load_rejects_python_tags(self):
+        with pytest.raises(YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")
+
+    def test_load_from_binary_stream(self, tmp_path):
+        path = tmp_path / "dbt_project.yml"
+        path.write_bytes("name: proj\nvars:\n  greeting: héllo\n".encode())
+        with path.open("rb") as stream:
+            assert load_yaml(stream) == {"name": "proj", "vars": {"greeting": "héllo"}}